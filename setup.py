@@ -0,0 +1,33 @@
+# ============================================================
+# Optional ahead-of-time compilation of the hot modules
+# ============================================================
+#
+# All package metadata lives in pyproject.toml. This file only exists so the
+# compiler, validator and helpers can be built as C extensions with mypyc:
+#
+#     pip install mypy
+#     EXLANG_USE_MYPYC=1 pip install --no-build-isolation .
+#
+# Without EXLANG_USE_MYPYC=1 (or if mypyc is not installed) a regular
+# pure-Python package is built and behaves identically.
+
+import os
+
+from setuptools import setup
+
+MYPYC_MODULES = [
+    "src/exlang/helpers.py",
+    "src/exlang/validator.py",
+    "src/exlang/compiler.py",
+]
+
+ext_modules = []
+if os.environ.get("EXLANG_USE_MYPYC") == "1":
+    try:
+        from mypyc.build import mypycify
+    except ImportError:
+        print("EXLANG_USE_MYPYC=1 but mypyc is not installed; building pure Python")
+    else:
+        ext_modules = mypycify(MYPYC_MODULES, opt_level="3")
+
+setup(ext_modules=ext_modules)
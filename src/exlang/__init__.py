@@ -4,14 +4,46 @@
 
 __version__ = "0.1.0"
 
-from .compiler import compile_xlang_to_xlsx
-from .validator import validate_xlang_minimal
-from .helpers import col_letter_to_index, infer_value, parse_merge_range
+from typing import TYPE_CHECKING
+
+from .validator import (
+    validate_xlang_minimal,
+    validate_xlang_minimal_first,
+    validate_xlang_stream,
+)
 from .io_utils import compile_file, validate_file, read_xlang_file
 
+if TYPE_CHECKING:
+    from .compiler import compile_xlang_to_xlsx
+    from .helpers import col_letter_to_index, infer_value, parse_merge_range
+
+# Compile-path names are imported on first access, so importing the package
+# for validation alone (e.g. `exlang validate` in a pre-commit hook) does not
+# load the compiler, helpers and xlsx writer
+_LAZY_ATTRS = {
+    "compile_xlang_to_xlsx": "compiler",
+    "col_letter_to_index": "helpers",
+    "infer_value": "helpers",
+    "parse_merge_range": "helpers",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
 __all__ = [
     "compile_xlang_to_xlsx",
     "validate_xlang_minimal",
+    "validate_xlang_minimal_first",
+    "validate_xlang_stream",
     "col_letter_to_index",
     "infer_value",
     "parse_merge_range",
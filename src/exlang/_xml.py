@@ -0,0 +1,144 @@
+# ============================================================
+# exlang._xml: XML parser selection
+# ============================================================
+
+from typing import Any
+from xml.etree import ElementTree as ET
+
+try:
+    from lxml import etree as _lxml
+except ImportError:
+    _lxml = None
+
+ParseError = ET.ParseError
+
+
+def fromstring(text: str | bytes):
+    """
+    Parse an exlang document into an element tree.
+
+    Uses lxml when it is installed and the stdlib ElementTree (C accelerated
+    on CPython) otherwise. Both trees expose the same .tag/.attrib/.text/
+    .findall API used by the compiler and validator.
+
+    With lxml, comments and processing instructions are dropped (matching
+    ElementTree) and syntax errors are re-raised as ElementTree's ParseError
+    so callers only ever need to catch one exception type. Indentation
+    between elements is discarded at parse time (whitespace-only text inside
+    a leaf such as <xv> </xv> is kept), and huge_tree lifts libxml2's size
+    limits on very large generated documents; entities are still never
+    resolved.
+
+    Raises:
+        ParseError: If the text is not well-formed XML
+    """
+    if _lxml is None:
+        return ET.fromstring(text)
+
+    if isinstance(text, str):
+        text = text.encode("utf-8")
+    parser = _lxml.XMLParser(
+        remove_comments=True,
+        remove_pis=True,
+        remove_blank_text=True,
+        huge_tree=True,
+        resolve_entities=False,
+        no_network=True,
+    )
+    try:
+        return _lxml.fromstring(text, parser)
+    except _lxml.XMLSyntaxError as e:
+        err = ParseError(str(e))
+        err.position = e.position
+        raise err from e
+
+
+def iterparse(text: str | bytes, events=("start", "end"), chunk_size: int = 64 * 1024):
+    """
+    Incrementally parse an exlang document, yielding (event, element) pairs.
+
+    The text is fed to a pull parser in chunks of chunk_size characters and
+    events are yielded as soon as they are available, so callers can process
+    and clear finished subtrees while the rest of the document is parsed.
+
+    Raises:
+        ParseError: If the text is not well-formed XML
+    """
+    if _lxml is None:
+        parser: Any = ET.XMLPullParser(events=events)
+        for start in range(0, len(text), chunk_size):
+            parser.feed(text[start:start + chunk_size])
+            yield from parser.read_events()
+        parser.close()
+        yield from parser.read_events()
+        return
+
+    if isinstance(text, str):
+        text = text.encode("utf-8")
+    lxml_parser = _lxml.XMLPullParser(
+        events=events,
+        remove_comments=True,
+        remove_pis=True,
+        remove_blank_text=True,
+        huge_tree=True,
+        resolve_entities=False,
+        no_network=True,
+    )
+    try:
+        for start in range(0, len(text), chunk_size):
+            lxml_parser.feed(text[start:start + chunk_size])
+            yield from lxml_parser.read_events()
+        lxml_parser.close()
+        yield from lxml_parser.read_events()
+    except _lxml.XMLSyntaxError as e:
+        err = ParseError(str(e))
+        err.position = e.position
+        raise err from e
+
+
+def iterchildren(text: str | bytes):
+    """
+    Incrementally parse a document, yielding its top-level elements.
+
+    The root element is yielded first, as soon as its start tag is read
+    (its tag and attributes are available, its children are not). After
+    that, each direct child of the root is yielded once its end tag is
+    read. When the consumer resumes, the child is cleared and detached
+    from the root, so memory stays bounded by the largest child rather
+    than the whole document.
+
+    Raises:
+        ParseError: If the text is not well-formed XML
+    """
+    root: Any = None
+    depth = 0
+    for event, elem in iterparse(text):
+        if event == "start":
+            if root is None:
+                root = elem
+                yield root
+            depth += 1
+            continue
+
+        depth -= 1
+        if depth == 1:
+            yield elem
+            elem.clear()
+            root.remove(elem)
+
+
+def tostring(elem) -> bytes:
+    """
+    Serialise an element (without its tail text) to UTF-8 bytes.
+
+    The result can be parsed again with fromstring(), which is how single
+    xsheet subtrees are shipped to worker processes.
+    """
+    if _lxml is not None and isinstance(elem, _lxml._Element):
+        return _lxml.tostring(elem, encoding="utf-8", with_tail=False)
+
+    tail, elem.tail = elem.tail, None
+    try:
+        return ET.tostring(elem, encoding="utf-8")
+    finally:
+        elem.tail = tail
@@ -2,17 +2,33 @@
 # exlang.compiler: compile exlang to Excel
 # ============================================================
 
+import os
+import threading
 from pathlib import Path
-from xml.etree import ElementTree as ET
+from typing import Any, BinaryIO, Callable
 
-from openpyxl import Workbook
-from openpyxl.styles import Font
-from openpyxl.utils import range_boundaries
-
-from .validator import validate_xlang_minimal
-from .helpers import col_letter_to_index, infer_value, parse_range, parse_merge_range, substitute_template_vars
-
-import re
+from ._xml import fromstring, iterchildren, tostring
+from .validator import sheet_name_collisions, validate_sheet, validate_xlang_minimal
+from .helpers import (
+    MAX_COLUMN,
+    MAX_ROW,
+    _infer_str_uncached,
+    col_letter_to_index,
+    compile_template,
+    expand_template,
+    infer_value,
+    parse_cell_address,
+    parse_range,
+    parse_merge_range,
+)
+from .xlsx_writer import (
+    STYLE_BOLD,
+    STYLE_ITALIC,
+    STYLE_UNDERLINE,
+    render_sheet,
+    unique_sheet_title,
+    write_workbook,
+)
 
 
 def _escape_xml_chars(value: str) -> str:
@@ -106,7 +122,389 @@ def auto_escape_formula_attributes(xlang_text: str) -> str:
     return _manual_escape(xlang_text)
 
 
-def compile_xlang_to_xlsx(xlang_text: str, output_path: str | Path) -> None:
+# Output directories already created by this process; batch compiles into
+# the same directory skip the mkdir syscall after the first file.
+_MKDIR_SEEN: set[str] = set()
+
+
+def _ensure_parent_dir(path: Path) -> None:
+    parent = str(path.parent)
+    if parent in _MKDIR_SEEN:
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    _MKDIR_SEEN.add(parent)
+
+
+# Inputs at least this long (in characters) are parsed incrementally, one
+# xsheet at a time; below it a single fromstring() call is cheaper.
+STREAM_THRESHOLD = 64 * 1024
+
+
+def _raise_if_invalid(errors: list[str]) -> None:
+    if errors:
+        formatted = "\n".join("  - " + e for e in errors)
+        raise ValueError("Invalid XLang:\n" + formatted)
+
+
+# Recently compiled documents (after auto-escaping) that passed validation;
+# recompiling the same template to another output path skips revalidation.
+# Keyed by the text itself, so a hash collision can never skip a check.
+# Documents of STREAM_THRESHOLD characters or more are never stored: keeping
+# them alive would undo the streaming path's memory bound.
+VALIDATION_MEMO_SIZE = 32
+_VALIDATED: dict[str, None] = {}
+_VALIDATED_LOCK = threading.Lock()
+
+
+def _remember_valid(xlang_text: str) -> None:
+    if len(xlang_text) >= STREAM_THRESHOLD:
+        return
+    # Eviction iterates the dict, so concurrent compiles must not interleave
+    with _VALIDATED_LOCK:
+        if len(_VALIDATED) >= VALIDATION_MEMO_SIZE:
+            # Evict the oldest entry (dicts keep insertion order)
+            del _VALIDATED[next(iter(_VALIDATED))]
+        _VALIDATED[xlang_text] = None
+
+
+def _render_sheet_xml(xsheet_xml: bytes) -> bytes:
+    """Compile one serialised xsheet to worksheet XML (runs in a worker process)."""
+    return render_sheet(*_compile_sheet(fromstring(xsheet_xml)))
+
+
+def _sheet_content(xsheet: Any, pool: Any = None) -> Any:
+    """
+    Compile one xsheet in-process, or hand it to the pool.
+
+    Returns the (cells, styles, merges) buffers, or a Future resolving to
+    the rendered worksheet XML when a pool is given.
+    """
+    if pool is None:
+        return _compile_sheet(xsheet)
+    return pool.submit(_render_sheet_xml, tostring(xsheet))
+
+
+def _compile_tree(xlang_text: str, pool: Any = None, validate: bool = True) -> list:
+    """Parse the whole document, validate it, then compile every sheet."""
+    root = fromstring(xlang_text)
+    if validate:
+        _raise_if_invalid(validate_xlang_minimal(root))
+
+    namer = _SheetNamer()
+    return [
+        (namer.title_for(xsheet), _sheet_content(xsheet, pool))
+        for xsheet in root.iterfind("xsheet")
+    ]
+
+
+def _compile_stream(xlang_text: str, pool: Any = None, validate: bool = True) -> list:
+    """
+    Parse the document incrementally, validating and compiling each xsheet
+    as soon as its end tag is read and then discarding its subtree.
+
+    A sheet is the smallest unit that can be compiled on its own, because
+    xrow/xrange/xrepeat/xcell precedence spans the whole sheet. Nothing is
+    compiled once an error has been seen, and all errors (including sheet
+    name collisions, which need every sheet) are raised before any output
+    is written, exactly as in _compile_tree().
+    """
+    namer = _SheetNamer()
+    explicit_names: set[str] = set()
+    auto_generated_count = 0
+    element_errors: list[str] = []
+    sheets: list = []
+
+    # Each finished sheet is dropped once handled, so memory stays bounded
+    # by the largest sheet
+    children = iterchildren(xlang_text)
+    root = next(children)
+    if validate and root.tag != "xworkbook":
+        _raise_if_invalid([f"Root tag must be 'xworkbook' but found '{root.tag}'"])
+
+    for elem in children:
+        if elem.tag != "xsheet":
+            continue
+
+        if validate:
+            name = elem.attrib.get("name")
+            if name:
+                explicit_names.add(name)
+            else:
+                auto_generated_count += 1
+            element_errors.extend(validate_sheet(elem))
+
+        if not element_errors:
+            sheets.append((namer.title_for(elem), _sheet_content(elem, pool)))
+
+    _raise_if_invalid(sheet_name_collisions(explicit_names, auto_generated_count) + element_errors)
+    return sheets
+
+
+# Values rendered from {{i}} templates are almost all distinct, so they skip
+# infer_value()'s memo: every lookup would miss and evict a useful entry
+_infer_rendered = _infer_str_uncached
+
+
+class _SheetNamer:
+    """Assign final titles to sheets in document order."""
+
+    def __init__(self) -> None:
+        self.auto_counter = 1
+        self.titles: list[str] = []
+
+    def title_for(self, xsheet: Any) -> str:
+        # Auto-generate sheet names for unnamed sheets
+        sheet_name = xsheet.attrib.get("name")
+        if not sheet_name:
+            sheet_name = f"Sheet{self.auto_counter}"
+            self.auto_counter += 1
+        sheet_name = unique_sheet_title(sheet_name, self.titles)
+        self.titles.append(sheet_name)
+        return sheet_name
+
+
+def _check_bounds(tag: str, first_row: int, first_col: int, last_row: int, last_col: int) -> None:
+    """
+    Raise ValueError unless rows first_row..last_row and columns
+    first_col..last_col all lie on the worksheet (A1:XFD1048576).
+
+    Checked while the buffers are built, so the writer never meets a cell it
+    cannot emit halfway through an archive.
+    """
+    if first_row < 1 or last_row > MAX_ROW:
+        row = first_row if first_row < 1 else last_row
+        raise ValueError(f"Row out of range in {tag}: {row}")
+    if first_col < 1 or last_col > MAX_COLUMN:
+        col = first_col if first_col < 1 else last_col
+        raise ValueError(f"Column out of range in {tag}: {col}")
+
+
+def _compile_sheet(xsheet: Any) -> tuple[dict, dict, list]:
+    """
+    Resolve one xsheet element into sparse cell, style and merge buffers.
+
+    Returns:
+        Tuple of (cells, styles, merges): row -> {col: value},
+        row -> {col: style id} and a list of merged ranges
+    """
+    # Sparse row -> col -> value buffers; later writes replace earlier ones
+    cells: dict[int, dict[int, object]] = {}
+    styles: dict[int, dict[int, int]] = {}
+    merges: list[tuple[int, int, int, int]] = []
+
+    # Bucket children by tag in one pass, keeping document order within each tag
+    rows: list[Any] = []
+    ranges: list[Any] = []
+    repeats: list[Any] = []
+    xcells: list[Any] = []
+    xmerges: list[Any] = []
+    xstyles: list[Any] = []
+    bucket_for = {
+        "xrow": rows,
+        "xrange": ranges,
+        "xrepeat": repeats,
+        "xcell": xcells,
+        "xmerge": xmerges,
+        "xstyle": xstyles,
+    }.get
+    for child in xsheet:
+        bucket = bucket_for(child.tag)
+        if bucket is not None:
+            bucket.append(child)
+
+    # Process in order: xrow → xrange → xrepeat → xcell (last write wins)
+    for xrow in rows:
+        attr = xrow.attrib
+        row_idx = int(attr["r"])
+        start_col_letter = attr.get("c", "A")
+        start_col_idx = col_letter_to_index(start_col_letter)
+        xvs = xrow.findall("xv")
+        _check_bounds("xrow", row_idx, start_col_idx, row_idx, start_col_idx + max(len(xvs), 1) - 1)
+        row_cells = cells.setdefault(row_idx, {})
+
+        for offset, xv in enumerate(xvs):
+            raw_value = xv.text or ""
+            row_cells[start_col_idx + offset] = infer_value(raw_value, None)
+
+    for xrange in ranges:
+        attr = xrange.attrib
+        from_addr = attr["from"]
+        to_addr = attr["to"]
+        fill_value = attr["fill"]
+        type_hint = attr.get("t")
+
+        from_row, from_col, to_row, to_col = parse_range(from_addr, to_addr)
+        _check_bounds("xrange", from_row, from_col, to_row, to_col)
+        inferred_value = infer_value(fill_value, type_hint)
+
+        # Fill each row with one C-level dict.update instead of a per-cell loop
+        fill = dict.fromkeys(range(from_col, to_col + 1), inferred_value)
+        for row in range(from_row, to_row + 1):
+            existing = cells.get(row)
+            if existing is None:
+                cells[row] = fill.copy()
+            else:
+                existing.update(fill)
+
+    for xrepeat in repeats:
+        attr = xrepeat.attrib
+        times = int(attr["times"])
+        direction = attr.get("direction", "down")
+        start_row = int(attr.get("r", "1"))
+        start_col_letter = attr.get("c", "A")
+        start_col_idx = col_letter_to_index(start_col_letter)
+
+        # Classify templates once: constants are inferred up front, texts
+        # referencing {{i}} / {{i0}} become format patterns expanded per iteration
+        templates: list[tuple[bool, Any]] = []
+        for xv in xrepeat.findall("xv"):
+            text = xv.text or ""
+            if "{{i" in text:
+                templates.append((True, compile_template(text)))
+            else:
+                templates.append((False, infer_value(text, None)))
+
+        # Iterations run down rows or across columns; templates fill the other axis
+        span = max(times, 1) - 1
+        width = max(len(templates), 1) - 1
+        if direction == "down":
+            _check_bounds("xrepeat", start_row, start_col_idx, start_row + span, start_col_idx + width)
+        else:
+            _check_bounds("xrepeat", start_row, start_col_idx, start_row + width, start_col_idx + span)
+
+        if direction == "down":
+            # Iteration i fills row start_row + i - 1, one column per xv
+            if not any(is_dynamic for is_dynamic, _ in templates):
+                # Every row is identical: fill like xrange, one dict.update per row
+                block: dict[int, object] = {
+                    start_col_idx + offset: template
+                    for offset, (_, template) in enumerate(templates)
+                }
+                for row in range(start_row, start_row + times):
+                    existing = cells.get(row)
+                    if existing is None:
+                        cells[row] = block.copy()
+                    else:
+                        existing.update(block)
+                continue
+
+            row_dicts = [cells.setdefault(row, {}) for row in range(start_row, start_row + times)]
+            for offset, (is_dynamic, template) in enumerate(templates):
+                col = start_col_idx + offset
+                if is_dynamic:
+                    # Render the whole column up front, then place it
+                    values = [_infer_rendered(text, None) for text in expand_template(template, times)]
+                    for row_cells, value in zip(row_dicts, values):
+                        row_cells[col] = value
+                else:
+                    for row_cells in row_dicts:
+                        row_cells[col] = template
+        else:  # direction == "right"
+            # Iteration i fills column start_col_idx + i - 1, one row per xv;
+            # each template's row is filled with one dict.update
+            template_cols = range(start_col_idx, start_col_idx + times)
+            for offset, (is_dynamic, template) in enumerate(templates):
+                row_cells = cells.setdefault(start_row + offset, {})
+                if is_dynamic:
+                    values = [_infer_rendered(text, None) for text in expand_template(template, times)]
+                    row_cells.update(zip(template_cols, values))
+                else:
+                    row_cells.update(dict.fromkeys(template_cols, template))
+
+    for xcell in xcells:
+        attr = xcell.attrib
+        addr = attr["addr"]
+        raw_value = attr["v"]
+        type_hint = attr.get("t")
+        row, col = parse_cell_address(addr)
+        _check_bounds("xcell", row, col, row, col)
+        cells.setdefault(row, {})[col] = infer_value(raw_value, type_hint)
+
+    # Process xmerge (merge cells)
+    for xmerge in xmerges:
+        addr = xmerge.attrib["addr"]
+        # Parse merge range (e.g., "A1:B1")
+        start_row, start_col, end_row, end_col = parse_merge_range(addr)
+        if start_row > end_row or start_col > end_col:
+            raise ValueError(f"Merge range {addr} must run from top-left to bottom-right")
+        _check_bounds("xmerge", start_row, start_col, end_row, end_col)
+        merges.append((start_row, start_col, end_row, end_col))
+        # Only the top-left cell of a merged range keeps its value
+        for row in range(start_row, end_row + 1):
+            merged_row = cells.get(row)
+            if not merged_row:
+                continue
+            for col in range(start_col, end_col + 1):
+                if (row, col) != (start_row, start_col):
+                    merged_row.pop(col, None)
+
+    # Process xstyle (apply formatting)
+    for xstyle in xstyles:
+        attr = xstyle.attrib
+        addr = attr["addr"]
+
+        # Check if addr is a range or single cell
+        if ":" in addr:
+            # Range notation (e.g., "A1:B10")
+            start_row, start_col, end_row, end_col = parse_merge_range(addr)
+        else:
+            # Single cell
+            start_row, start_col = parse_cell_address(addr)
+            end_row, end_col = start_row, start_col
+        _check_bounds("xstyle", start_row, start_col, end_row, end_col)
+
+        # Build font style id from attributes
+        style_id = 0
+        if attr.get("bold") == "true":
+            style_id |= STYLE_BOLD
+        if attr.get("italic") == "true":
+            style_id |= STYLE_ITALIC
+        if attr.get("underline") == "true":
+            style_id |= STYLE_UNDERLINE
+
+        # Apply font to all cells, one row-sized dict.update per row
+        row_styles = dict.fromkeys(range(start_col, end_col + 1), style_id)
+        for row in range(start_row, end_row + 1):
+            styles.setdefault(row, {}).update(row_styles)
+
+    return cells, styles, merges
+
+
+BACKENDS = ("builtin", "xlsxwriter")
+
+
+def _workbook_writer(backend: str) -> Callable[[Any, list], None]:
+    """Return the write_workbook() implementation for a backend name."""
+    if backend == "builtin":
+        return write_workbook
+    if backend == "xlsxwriter":
+        from . import xlsxwriter_backend
+
+        return xlsxwriter_backend.write_workbook
+    raise ValueError(
+        f"Unknown backend '{backend}'. Must be one of: {', '.join(BACKENDS)}"
+    )
+
+
+def _compile_sheets(xlang_text: str, pool: Any = None, validate: bool = True) -> list:
+    """Compile every sheet, resolving any pending worker results."""
+    if len(xlang_text) < STREAM_THRESHOLD:
+        sheets = _compile_tree(xlang_text, pool, validate)
+    else:
+        sheets = _compile_stream(xlang_text, pool, validate)
+    if pool is None:
+        return sheets
+    return [(title, future.result()) for title, future in sheets]
+
+
+def compile_xlang_to_xlsx(
+    xlang_text: str,
+    output_path: str | os.PathLike | BinaryIO,
+    *,
+    validate: bool = True,
+    workers: int = 1,
+    backend: str = "builtin",
+) -> None:
     """
     Compile a minimal subset of exlang into an Excel .xlsx file.
     
@@ -126,7 +524,26 @@ def compile_xlang_to_xlsx(xlang_text: str, output_path: str | Path) -> None:
     
     Args:
         xlang_text: EXLang XML string
-        output_path: Path to output .xlsx file
+        output_path: Path to output .xlsx file, or a writable binary file
+            object (e.g. io.BytesIO) to receive the package instead
+        validate: Check the document against the exlang rules before
+            compiling. Pass False only for trusted, machine-generated input;
+            invalid documents then fail with whatever error compilation hits
+            (typically KeyError or ValueError) instead of a full error report.
+            Documents that recently passed validation are not re-checked.
+        workers: Number of worker processes used to compile and render
+            sheets in parallel. The default of 1 compiles in-process; larger
+            values only pay off for workbooks with several large sheets.
+            Scripts using workers > 1 need an ``if __name__ == "__main__":``
+            guard on platforms that spawn worker processes.
+        backend: Workbook writer. "builtin" (the default) streams
+            SpreadsheetML directly; "xlsxwriter" writes through the optional
+            XlsxWriter package (pip install exlang[xlsxwriter]). Parallel
+            workers require the built-in writer.
+
+    Raises:
+        ValueError: If the document is invalid, places a cell outside
+            A1:XFD1048576, or backend is unknown
     
     Example with complex formulas:
         xlang = '''
@@ -143,134 +560,37 @@ def compile_xlang_to_xlsx(xlang_text: str, output_path: str | Path) -> None:
         v='=IF(A1>=100,"Pass","Fail")'  ✓ Correct
         v="=IF(A1>=100,"Pass","Fail")"  ✗ Invalid Python syntax
     """
+    write = _workbook_writer(backend)
+    if workers > 1 and write is not write_workbook:
+        raise ValueError("workers > 1 requires the 'builtin' backend")
+
     # Auto-escape formulas with XML special characters
     xlang_text = auto_escape_formula_attributes(xlang_text)
-    
-    root = ET.fromstring(xlang_text)
+    needs_validation = validate and xlang_text not in _VALIDATED
 
-    errors = validate_xlang_minimal(root)
-    if errors:
-        formatted = "\n".join("  - " + e for e in errors)
-        raise ValueError("Invalid XLang:\n" + formatted)
+    if workers > 1:
+        # Imported here: concurrent.futures.process pulls in multiprocessing
+        # and logging, which in-process compiles never need
+        from concurrent.futures import ProcessPoolExecutor
 
-    wb = Workbook()
-    wb.remove(wb.active)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            sheets = _compile_sheets(xlang_text, pool, needs_validation)
+    else:
+        sheets = _compile_sheets(xlang_text, validate=needs_validation)
+    if needs_validation:
+        _remember_valid(xlang_text)
 
-    # Auto-generate sheet names for unnamed sheets
-    auto_counter = 1
-    for xsheet in root.findall("xsheet"):
-        sheet_name = xsheet.attrib.get("name")
-        if not sheet_name:
-            sheet_name = f"Sheet{auto_counter}"
-            auto_counter += 1
-        ws = wb.create_sheet(title=sheet_name)
-
-        # Process in order: xrow → xrange → xrepeat → xcell (last write wins)
-        for xrow in xsheet.findall("xrow"):
-            row_idx = int(xrow.attrib["r"])
-            start_col_letter = xrow.attrib.get("c", "A")
-            start_col_idx = col_letter_to_index(start_col_letter)
-
-            for offset, xv in enumerate(xrow.findall("xv")):
-                raw_value = xv.text or ""
-                value = infer_value(raw_value, None)
-                ws.cell(
-                    row=row_idx,
-                    column=start_col_idx + offset,
-                    value=value,
-                )
-
-        for xrange in xsheet.findall("xrange"):
-            from_addr = xrange.attrib["from"]
-            to_addr = xrange.attrib["to"]
-            fill_value = xrange.attrib["fill"]
-            type_hint = xrange.attrib.get("t")
-            
-            from_row, from_col, to_row, to_col = parse_range(from_addr, to_addr)
-            inferred_value = infer_value(fill_value, type_hint)
-            
-            for row in range(from_row, to_row + 1):
-                for col in range(from_col, to_col + 1):
-                    ws.cell(row=row, column=col, value=inferred_value)
-
-        for xrepeat in xsheet.findall("xrepeat"):
-            times = int(xrepeat.attrib["times"])
-            direction = xrepeat.attrib.get("direction", "down")
-            start_row = int(xrepeat.attrib.get("r", "1"))
-            start_col_letter = xrepeat.attrib.get("c", "A")
-            start_col_idx = col_letter_to_index(start_col_letter)
-            
-            # Extract template xv elements
-            template_xvs = list(xrepeat.findall("xv"))
-            
-            for i in range(1, times + 1):
-                # Calculate current position based on direction
-                if direction == "down":
-                    current_row = start_row + (i - 1)
-                    current_col = start_col_idx
-                else:  # direction == "right"
-                    current_row = start_row
-                    current_col = start_col_idx + (i - 1)
-                
-                # Process each xv in the template
-                for offset, xv in enumerate(template_xvs):
-                    raw_value = xv.text or ""
-                    # Substitute template variables
-                    substituted_value = substitute_template_vars(raw_value, i)
-                    value = infer_value(substituted_value, None)
-                    
-                    # Calculate final cell position
-                    if direction == "down":
-                        ws.cell(row=current_row, column=current_col + offset, value=value)
-                    else:  # direction == "right"
-                        ws.cell(row=current_row + offset, column=current_col, value=value)
-
-        for xcell in xsheet.findall("xcell"):
-            addr = xcell.attrib["addr"]
-            raw_value = xcell.attrib["v"]
-            type_hint = xcell.attrib.get("t")
-            value = infer_value(raw_value, type_hint)
-            ws[addr] = value
-
-        # Process xmerge (merge cells)
-        for xmerge in xsheet.findall("xmerge"):
-            addr = xmerge.attrib["addr"]
-            # Parse merge range (e.g., "A1:B1")
-            start_row, start_col, end_row, end_col = parse_merge_range(addr)
-            ws.merge_cells(
-                start_row=start_row,
-                start_column=start_col,
-                end_row=end_row,
-                end_column=end_col
-            )
-
-        # Process xstyle (apply formatting)
-        for xstyle in xsheet.findall("xstyle"):
-            addr = xstyle.attrib["addr"]
-            
-            # Check if addr is a range or single cell
-            if ":" in addr:
-                # Range notation (e.g., "A1:B10")
-                start_row, start_col, end_row, end_col = parse_merge_range(addr)
-                cells_to_style = []
-                for row in range(start_row, end_row + 1):
-                    for col in range(start_col, end_col + 1):
-                        cells_to_style.append(ws.cell(row=row, column=col))
-            else:
-                # Single cell
-                cells_to_style = [ws[addr]]
-            
-            # Build Font object from attributes
-            bold = xstyle.attrib.get("bold") == "true"
-            italic = xstyle.attrib.get("italic") == "true"
-            underline_val = "single" if xstyle.attrib.get("underline") == "true" else None
-            
-            font = Font(bold=bold, italic=italic, underline=underline_val)
-            
-            # Apply font to all cells
-            for cell in cells_to_style:
-                cell.font = font
+    if not isinstance(output_path, (str, os.PathLike)):
+        # File object: nothing to create on disk
+        write(output_path, sheets)
+        return
 
     output_path = Path(output_path)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    wb.save(str(output_path))
+    _ensure_parent_dir(output_path)
+    try:
+        write(output_path, sheets)
+    except FileNotFoundError:
+        # The directory was removed after we first created it; recreate and retry once
+        _MKDIR_SEEN.discard(str(output_path.parent))
+        _ensure_parent_dir(output_path)
+        write(output_path, sheets)
@@ -3,6 +3,30 @@
 # ============================================================
 
 import re
+import string
+from functools import lru_cache
+from itertools import product
+from typing import Any, Callable
+
+
+MAX_COLUMN = 16384  # XFD
+MAX_ROW = 1048576
+
+
+def _gen_col_letters() -> list[str]:
+    """Build the 1-based column letter table (index 0 is unused)."""
+    letters = string.ascii_uppercase
+    table = [""]
+    table.extend(letters)
+    table.extend(a + b for a, b in product(letters, repeat=2))
+    table.extend(a + b + c for a, b, c in product(letters, repeat=3))
+    del table[MAX_COLUMN + 1:]
+    return table
+
+
+# Lookup tables for every valid Excel column, built once at import
+COL_LETTERS = _gen_col_letters()
+COL_INDEX = {letters: idx for idx, letters in enumerate(COL_LETTERS) if letters}
 
 
 def col_letter_to_index(col: str) -> int:
@@ -10,63 +34,66 @@ def col_letter_to_index(col: str) -> int:
     Convert Excel column letters (A, B, Z, AA, AB etc.)
     into a 1-based integer column index.
     """
+    idx = COL_INDEX.get(col)
+    if idx is not None:
+        return idx
+
     col = col.strip().upper()
-    result = 0
+    idx = COL_INDEX.get(col)
+    if idx is not None:
+        return idx
 
+    # Past XFD (or empty): validate the letters, then reject out-of-range columns
+    result = 0
     for ch in col:
         if not ("A" <= ch <= "Z"):
             raise ValueError(f"Invalid column letter: {col}")
         result = result * 26 + (ord(ch) - ord("A") + 1)
+    if result > MAX_COLUMN:
+        raise ValueError(f"Column out of range: {col}")
 
     return result
 
 
-def infer_value(raw: str, type_hint: str | None = None):
-    """
-    Infer the correct Python type for a cell value.
+_INT_PATTERN = re.compile(r"[+-]?\d+")
+_FLOAT_PATTERN = re.compile(r"[+-]?\d*\.\d+")
 
-    - Formulas (starting with '=') stay as strings.
-    - Optional type hints control behaviour where provided.
-    - Otherwise, try int, then float, else keep as string.
-    """
-    if raw is None:
-        return None
 
-    raw = str(raw)
+def _as_string(raw: str):
+    return raw
 
-    if raw.startswith("="):
-        return raw
 
-    if type_hint == "string":
-        return raw
+def _as_bool(raw: str):
+    upper = raw.strip().upper()
+    if upper in {"TRUE", "YES"}:
+        return True
+    if upper in {"FALSE", "NO"}:
+        return False
+    return raw
 
-    if type_hint == "bool":
-        upper = raw.strip().upper()
-        if upper in {"TRUE", "YES"}:
-            return True
-        if upper in {"FALSE", "NO"}:
-            return False
-        return raw
 
-    if type_hint == "number":
+def _as_number(raw: str):
+    try:
+        return int(raw)
+    except ValueError:
         try:
-            return int(raw)
+            return float(raw)
         except ValueError:
-            try:
-                return float(raw)
-            except ValueError:
-                return raw
+            return raw
 
-    if type_hint == "date":
-        return raw  # you can add real date parsing later
 
+def _as_date(raw: str):
+    return raw  # you can add real date parsing later
+
+
+def _auto_infer(raw: str):
     stripped = raw.strip()
-    if re.fullmatch(r"[+-]?\d+", stripped):
+    if _INT_PATTERN.fullmatch(stripped):
         try:
             return int(stripped)
         except ValueError:
             pass
-    if re.fullmatch(r"[+-]?\d*\.\d+", stripped):
+    if _FLOAT_PATTERN.fullmatch(stripped):
         try:
             return float(stripped)
         except ValueError:
@@ -75,6 +102,43 @@ def infer_value(raw: str, type_hint: str | None = None):
     return raw
 
 
+# Type hint -> converter; unknown or missing hints use automatic inference
+_TYPE_HINT_CONVERTERS: dict[str | None, Callable[[str], Any]] = {
+    "string": _as_string,
+    "bool": _as_bool,
+    "number": _as_number,
+    "date": _as_date,
+}
+
+
+def infer_value(raw: Any, type_hint: str | None = None):
+    """
+    Infer the correct Python type for a cell value.
+
+    - Formulas (starting with '=') stay as strings.
+    - Optional type hints control behaviour where provided.
+    - Otherwise, try int, then float, else keep as string.
+
+    Any value is accepted and converted with str() first; the conversion
+    itself is memoised on that string (see _infer_str()).
+    """
+    if raw is None:
+        return None
+    return _infer_str(str(raw), type_hint)
+
+
+def _infer_str_uncached(raw: str, type_hint: str | None = None):
+    """infer_value() for a string, without the memo."""
+    if raw.startswith("="):
+        return raw
+
+    return _TYPE_HINT_CONVERTERS.get(type_hint, _auto_infer)(raw)
+
+
+# Memoised since xrange and xrepeat expansion repeat the same inputs
+_infer_str = lru_cache(maxsize=256)(_infer_str_uncached)
+
+
 def parse_cell_address(addr: str) -> tuple[int, int]:
     """
     Parse Excel cell address (e.g., 'B4', 'AA10') into (row, col) 1-based indices.
@@ -95,8 +159,11 @@ def parse_cell_address(addr: str) -> tuple[int, int]:
         (4, 2)
         >>> parse_cell_address('AA10')
         (10, 27)
+        >>> parse_cell_address('$B$4')
+        (4, 2)
     """
-    addr = addr.strip().upper()
+    # Absolute references ($A$1) address the same cell
+    addr = addr.strip().upper().replace("$", "")
     match = re.match(r'^([A-Z]+)(\d+)$', addr)
     
     if not match:
@@ -214,9 +281,89 @@ def substitute_template_vars(text: str, iteration_index: int) -> str:
         return None
     
     text = str(text)
+    # Most cells carry no template variables; one substring scan settles it
+    if "{{" not in text:
+        return text
     # Substitute {{i}} with 1-based index
-    text = text.replace("{{i}}", str(iteration_index))
+    if "{{i}}" in text:
+        text = text.replace("{{i}}", str(iteration_index))
     # Substitute {{i0}} with 0-based index
-    text = text.replace("{{i0}}", str(iteration_index - 1))
+    if "{{i0}}" in text:
+        text = text.replace("{{i0}}", str(iteration_index - 1))
     
     return text
+
+
+def compile_template(text: str) -> str:
+    """
+    Convert template variables into a str.format_map() pattern.
+
+    Literal braces are escaped first, so only {{i}} and {{i0}} become
+    replacement fields. Formatting the result with {"i": i, "i0": i - 1}
+    gives the same text as substitute_template_vars(text, i), but does the
+    scanning once up front instead of on every iteration.
+
+    Examples:
+        >>> compile_template("Month {{i}}")
+        'Month {i}'
+        >>> compile_template("{x} {{i0}}")
+        '{{x}} {i0}'
+    """
+    escaped = text.replace("{", "{{").replace("}", "}}")
+    return escaped.replace("{{{{i0}}}}", "{i0}").replace("{{{{i}}}}", "{i}")
+
+
+def expand_template(pattern: str, times: int) -> list[str]:
+    """
+    Render a compile_template() pattern for iterations 1..times.
+
+    All values are produced in a single list comprehension, so callers can
+    fill a whole xrepeat column (or row) at once.
+
+    Repeats of at least CODEGEN_MIN_TIMES iterations use a generated
+    function (see _template_expander()); shorter ones format directly, since
+    generating the function costs more than it saves on a few iterations.
+
+    Examples:
+        >>> expand_template("Row {i}", 3)
+        ['Row 1', 'Row 2', 'Row 3']
+    """
+    if times < CODEGEN_MIN_TIMES:
+        fmt = pattern.format
+        return [fmt(i=i, i0=i - 1) for i in range(1, times + 1)]
+    return _template_expander(pattern)(1, times)
+
+
+# Generating an expander costs about as much as formatting ~150 values, so
+# below this many iterations it would not pay for itself even once
+CODEGEN_MIN_TIMES = 256
+
+
+# Template fields and the f-string expression each one becomes
+_TEMPLATE_FIELDS = {"i": "{i}", "i0": "{i - 1}"}
+
+
+@lru_cache(maxsize=256)
+def _template_expander(pattern: str) -> Callable[[int, int], list[str]]:
+    """
+    Generate a function rendering pattern for iterations start..stop.
+
+    The pattern is turned into an f-string inside a list comprehension, so
+    each value is built by a single f-string instead of a format() call
+    that re-parses the pattern. Literal text is escaped into the generated
+    source and never evaluated.
+    """
+    parts = []
+    for literal, field, _, _ in string.Formatter().parse(pattern):
+        escaped = literal.encode("unicode_escape").decode("ascii").replace('"', '\\"')
+        parts.append(escaped.replace("{", "{{").replace("}", "}}"))
+        if field is not None:
+            parts.append(_TEMPLATE_FIELDS[field])
+
+    src = (
+        "def expand(start, stop):\n"
+        f'    return [f"{"".join(parts)}" for i in range(start, stop + 1)]\n'
+    )
+    namespace: dict[str, Any] = {}
+    exec(src, namespace)
+    return namespace["expand"]
@@ -3,10 +3,9 @@
 # ============================================================
 
 from pathlib import Path
-from xml.etree import ElementTree as ET
 
-from .compiler import compile_xlang_to_xlsx
-from .validator import validate_xlang_minimal
+from ._xml import ParseError
+from .validator import validate_xlang_stream
 
 
 def read_xlang_file(path: str | Path) -> str:
@@ -38,8 +37,11 @@ def compile_file(input_path: str | Path, output_path: str | Path) -> None:
     Raises:
         FileNotFoundError: Input file not found
         ValueError: Invalid EXLANG syntax or validation errors
-        ET.ParseError: Malformed XML
+        ParseError: Malformed XML (xml.etree.ElementTree.ParseError)
     """
+    # Deferred so validate-only workflows never load the compiler and writer
+    from .compiler import compile_xlang_to_xlsx
+
     xlang_text = read_xlang_file(input_path)
     compile_xlang_to_xlsx(xlang_text, output_path)
 
@@ -63,8 +65,7 @@ def validate_file(path: str | Path) -> tuple[bool, list[str]]:
     xlang_text = read_xlang_file(path)
     
     try:
-        root = ET.fromstring(xlang_text)
-        errors = validate_xlang_minimal(root)
+        errors = validate_xlang_stream(xlang_text)
         return (len(errors) == 0, errors)
-    except ET.ParseError as e:
+    except ParseError as e:
         return (False, [f"XML Parse Error: {str(e)}"])
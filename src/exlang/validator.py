@@ -2,7 +2,9 @@
 # exlang.validator: minimal schema checks
 # ============================================================
 
-from xml.etree import ElementTree as ET
+from collections.abc import Callable, Iterator
+
+from ._xml import ET, iterchildren
 
 ALLOWED_TYPES = {"number", "string", "date", "bool"}
 ALLOWED_DIRECTIONS = {"down", "right"}
@@ -24,24 +26,221 @@ def validate_xlang_minimal(root: ET.Element) -> list[str]:
       - Optional t attributes use only allowed type names
       - Optional direction attribute uses only allowed directions
     """
-    errors: list[str] = []
+    # Sheet names are collected during the same traversal that checks children;
+    # collision errors are reported ahead of element errors
+    sheet_names: list[str | None] = []
+    element_errors = list(_iter_errors(root, sheet_names))
+    return _name_collisions(sheet_names) + element_errors
+
+
+def validate_xlang_minimal_first(root: ET.Element) -> str | None:
+    """
+    Return the first validation error in an exlang document, or None.
+
+    Applies the same rules as validate_xlang_minimal() but stops at the
+    first problem, so rejecting an invalid document costs only the walk up
+    to its first error. Sheet name collisions need every sheet and are only
+    checked once all elements have passed.
+    """
+    sheet_names: list[str | None] = []
+    first = next(_iter_errors(root, sheet_names), None)
+    if first is not None:
+        return first
+    collisions = _name_collisions(sheet_names)
+    return collisions[0] if collisions else None
+
 
+def validate_xlang_stream(xlang_text: str | bytes) -> list[str]:
+    """
+    Validate an exlang document without building its full tree.
+
+    Returns the same errors, in the same order, as validate_xlang_minimal(),
+    but parses incrementally and discards each xsheet once it has been
+    checked, so peak memory is bounded by the largest sheet rather than the
+    whole document.
+
+    Raises:
+        ParseError: If the text is not well-formed XML
+    """
+    children = iterchildren(xlang_text)
+    root = next(children)
     if root.tag != "xworkbook":
-        errors.append(f"Root tag must be 'xworkbook' but found '{root.tag}'")
-        return errors
-
-    # Check for collisions between auto-generated and explicit sheet names
-    explicit_names = set()
-    auto_generated_count = 0
-    
-    for sheet in root.findall("xsheet"):
-        name = sheet.attrib.get("name")
-        if name:
-            explicit_names.add(name)
-        else:
-            auto_generated_count += 1
-    
-    # Check if auto-generated names would conflict with explicit names
+        return [f"Root tag must be 'xworkbook' but found '{root.tag}'"]
+
+    sheet_names: list[str | None] = []
+    element_errors: list[str] = []
+    for child in children:
+        if child.tag == "xsheet":
+            sheet_names.append(child.attrib.get("name"))
+            element_errors.extend(_iter_sheet_errors(child))
+    return _name_collisions(sheet_names) + element_errors
+
+
+def _iter_errors(root: ET.Element, sheet_names: list[str | None]) -> Iterator[str]:
+    """
+    Yield element errors in document order.
+
+    The name attribute of every xsheet visited (None when omitted) is
+    appended to sheet_names for the collision check.
+    """
+    if root.tag != "xworkbook":
+        yield f"Root tag must be 'xworkbook' but found '{root.tag}'"
+        return
+
+    for sheet in root.iterfind("xsheet"):
+        sheet_names.append(sheet.attrib.get("name"))
+        yield from _iter_sheet_errors(sheet)
+
+
+def _name_collisions(sheet_names: list[str | None]) -> list[str]:
+    explicit_names = {name for name in sheet_names if name}
+    auto_generated_count = sum(1 for name in sheet_names if not name)
+    return sheet_name_collisions(explicit_names, auto_generated_count)
+
+
+def validate_sheet(sheet: ET.Element) -> list[str]:
+    """
+    Check the children of one xsheet element.
+
+    Covers every per-element rule of validate_xlang_minimal(); sheet name
+    collisions need the whole workbook and are checked separately by
+    sheet_name_collisions().
+    """
+    return list(_iter_sheet_errors(sheet))
+
+
+def _iter_sheet_errors(sheet: ET.Element) -> Iterator[str]:
+    # One dict lookup per child picks its rules; unknown tags have none
+    rules_for = _CHILD_RULES.get
+    for child in sheet:
+        rules = rules_for(child.tag)
+        if rules is not None:
+            yield from rules(child)
+
+
+def _check_xrow(elem: ET.Element) -> Iterator[str]:
+    if "r" not in elem.attrib:
+        yield "xrow missing required attribute 'r'"
+
+
+def _check_xrepeat(elem: ET.Element) -> Iterator[str]:
+    attr = elem.attrib
+    if "times" not in attr:
+        yield "xrepeat missing required attribute 'times'"
+
+    # Validate times is a positive integer
+    times_str = attr.get("times", "")
+    if times_str:
+        times_error = _validate_times(times_str)
+        if times_error is not None:
+            yield times_error
+
+    # Validate direction if present
+    direction = attr.get("direction")
+    if direction is not None and direction not in ALLOWED_DIRECTIONS:
+        yield (
+            f"xrepeat has invalid direction='{direction}'. "
+            f"Must be one of: {', '.join(ALLOWED_DIRECTIONS)}"
+        )
+
+    # Check for nested xrepeat (not allowed)
+    if elem.find(".//xrepeat") is not None:
+        yield "Nested xrepeat is not allowed"
+
+    # Validate content contains only xv tags
+    for child in elem:
+        if child.tag != "xv":
+            yield f"xrepeat can only contain <xv> tags, found <{child.tag}>"
+
+
+def _validate_times(times_str: str) -> str | None:
+    """Return the error for an xrepeat times value, or None if it is valid."""
+    # Plain digits (optionally signed) are the normal case and always parse,
+    # so int() runs without exception handling; anything else (whitespace,
+    # underscores) gets int()'s full rules
+    unsigned = times_str[1:] if times_str[0] in "+-" else times_str
+    if unsigned.isdecimal():
+        times_val = int(times_str)
+    else:
+        try:
+            times_val = int(times_str)
+        except ValueError:
+            return f"xrepeat 'times' must be an integer, got '{times_str}'"
+    if times_val < 1:
+        return f"xrepeat 'times' must be >= 1, got {times_val}"
+    return None
+
+
+def _check_xcell(elem: ET.Element) -> Iterator[str]:
+    attr = elem.attrib
+    if "addr" not in attr:
+        yield "xcell missing required attribute 'addr'"
+    if "v" not in attr:
+        yield "xcell missing required attribute 'v'"
+    t = attr.get("t")
+    if t is not None and t not in ALLOWED_TYPES:
+        yield f"xcell at {attr.get('addr', '?')} has invalid type hint t='{t}'"
+
+
+def _check_xrange(elem: ET.Element) -> Iterator[str]:
+    attr = elem.attrib
+    if "from" not in attr:
+        yield "xrange missing required attribute 'from'"
+    if "to" not in attr:
+        yield "xrange missing required attribute 'to'"
+    if "fill" not in attr:
+        yield "xrange missing required attribute 'fill'"
+    t = attr.get("t")
+    if t is not None and t not in ALLOWED_TYPES:
+        yield (
+            f"xrange from {attr.get('from', '?')} to {attr.get('to', '?')} "
+            f"has invalid type hint t='{t}'"
+        )
+
+
+def _check_xmerge(elem: ET.Element) -> Iterator[str]:
+    addr = elem.attrib.get("addr")
+    if addr is None:
+        yield "xmerge missing required attribute 'addr'"
+    # Validate merge range format (A1:B1)
+    elif ":" not in addr:
+        yield f"xmerge addr '{addr}' must be a range (e.g., 'A1:B1')"
+    elif addr.count(":") != 1:
+        yield f"xmerge addr '{addr}' must have exactly one colon (e.g., 'A1:B1')"
+
+
+def _check_xstyle(elem: ET.Element) -> Iterator[str]:
+    attr = elem.attrib
+    if "addr" not in attr:
+        yield "xstyle missing required attribute 'addr'"
+
+    # Validate boolean style attributes
+    for style_attr in ("bold", "italic", "underline"):
+        value = attr.get(style_attr)
+        if value is not None and value not in ALLOWED_BOOL_VALUES:
+            yield (
+                f"xstyle at {attr.get('addr', '?')} has invalid {style_attr}='{value}'. "
+                f"Must be 'true' or 'false'"
+            )
+
+
+# Per-tag rules for the children of an xsheet
+_CHILD_RULES: dict[str, Callable[[ET.Element], Iterator[str]]] = {
+    "xrow": _check_xrow,
+    "xrepeat": _check_xrepeat,
+    "xcell": _check_xcell,
+    "xrange": _check_xrange,
+    "xmerge": _check_xmerge,
+    "xstyle": _check_xstyle,
+}
+
+
+def sheet_name_collisions(explicit_names: set[str], auto_generated_count: int) -> list[str]:
+    """
+    Report auto-generated sheet names (Sheet1, Sheet2, ...) that clash with
+    explicitly named sheets.
+    """
+    errors: list[str] = []
     for i in range(1, auto_generated_count + 1):
         auto_name = f"Sheet{i}"
         if auto_name in explicit_names:
@@ -49,96 +248,4 @@ def validate_xlang_minimal(root: ET.Element) -> list[str]:
                 f"Auto-generated sheet name '{auto_name}' conflicts with explicitly named sheet. "
                 f"Either name all sheets or ensure explicit names don't use 'Sheet1', 'Sheet2', etc."
             )
-
-    for sheet in root.findall("xsheet"):
-
-        for xrow in sheet.findall("xrow"):
-            if "r" not in xrow.attrib:
-                errors.append("xrow missing required attribute 'r'")
-
-        for xrepeat in sheet.findall("xrepeat"):
-            if "times" not in xrepeat.attrib:
-                errors.append("xrepeat missing required attribute 'times'")
-            
-            # Validate times is a positive integer
-            times_str = xrepeat.attrib.get("times", "")
-            if times_str:
-                try:
-                    times_val = int(times_str)
-                    if times_val < 1:
-                        errors.append(f"xrepeat 'times' must be >= 1, got {times_val}")
-                except ValueError:
-                    errors.append(f"xrepeat 'times' must be an integer, got '{times_str}'")
-            
-            # Validate direction if present
-            direction = xrepeat.attrib.get("direction")
-            if direction is not None and direction not in ALLOWED_DIRECTIONS:
-                errors.append(
-                    f"xrepeat has invalid direction='{direction}'. "
-                    f"Must be one of: {', '.join(ALLOWED_DIRECTIONS)}"
-                )
-            
-            # Check for nested xrepeat (not allowed)
-            if xrepeat.findall(".//xrepeat"):
-                errors.append("Nested xrepeat is not allowed")
-            
-            # Validate content contains only xv tags
-            for child in xrepeat:
-                if child.tag != "xv":
-                    errors.append(
-                        f"xrepeat can only contain <xv> tags, found <{child.tag}>"
-                    )
-
-        for xcell in sheet.findall("xcell"):
-            if "addr" not in xcell.attrib:
-                errors.append("xcell missing required attribute 'addr'")
-            if "v" not in xcell.attrib:
-                errors.append("xcell missing required attribute 'v'")
-            t = xcell.attrib.get("t")
-            if t is not None and t not in ALLOWED_TYPES:
-                errors.append(
-                    f"xcell at {xcell.attrib.get('addr', '?')} "
-                    f"has invalid type hint t='{t}'"
-                )
-
-        for xrange in sheet.findall("xrange"):
-            if "from" not in xrange.attrib:
-                errors.append("xrange missing required attribute 'from'")
-            if "to" not in xrange.attrib:
-                errors.append("xrange missing required attribute 'to'")
-            if "fill" not in xrange.attrib:
-                errors.append("xrange missing required attribute 'fill'")
-            t = xrange.attrib.get("t")
-            if t is not None and t not in ALLOWED_TYPES:
-                errors.append(
-                    f"xrange from {xrange.attrib.get('from', '?')} to {xrange.attrib.get('to', '?')} "
-                    f"has invalid type hint t='{t}'"
-                )
-
-        for xmerge in sheet.findall("xmerge"):
-            if "addr" not in xmerge.attrib:
-                errors.append("xmerge missing required attribute 'addr'")
-            else:
-                addr = xmerge.attrib["addr"]
-                # Validate merge range format (A1:B1)
-                if ":" not in addr:
-                    errors.append(f"xmerge addr '{addr}' must be a range (e.g., 'A1:B1')")
-                else:
-                    parts = addr.split(":")
-                    if len(parts) != 2:
-                        errors.append(f"xmerge addr '{addr}' must have exactly one colon (e.g., 'A1:B1')")
-
-        for xstyle in sheet.findall("xstyle"):
-            if "addr" not in xstyle.attrib:
-                errors.append("xstyle missing required attribute 'addr'")
-            
-            # Validate boolean style attributes
-            for attr in ["bold", "italic", "underline"]:
-                value = xstyle.attrib.get(attr)
-                if value is not None and value not in ALLOWED_BOOL_VALUES:
-                    errors.append(
-                        f"xstyle at {xstyle.attrib.get('addr', '?')} has invalid {attr}='{value}'. "
-                        f"Must be 'true' or 'false'"
-                    )
-
     return errors
@@ -0,0 +1,305 @@
+# ============================================================
+# exlang.xlsx_writer: direct SpreadsheetML emission
+# ============================================================
+
+import io
+import math
+import zipfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO
+
+from .helpers import COL_LETTERS
+
+try:
+    from lxml.etree import xmlfile, Element, SubElement
+except ImportError:
+    from et_xmlfile import xmlfile
+    from xml.etree.ElementTree import Element, SubElement
+
+
+SHEET_MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+INVALID_TITLE_CHARS = set("\\*?:/[]")
+MAX_TITLE_LENGTH = 31
+
+
+# ============================================================
+# Fixed package parts
+# ============================================================
+
+ROOT_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    f'<Relationships xmlns="{PKG_REL_NS}">'
+    '<Relationship Id="rId1" '
+    f'Type="{REL_NS}/officeDocument" Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+
+# Font table indexed by style id: bit 0 = bold, bit 1 = italic, bit 2 = underline.
+# Style id 0 is the workbook default, so unstyled cells need no s attribute.
+STYLE_BOLD = 1
+STYLE_ITALIC = 2
+STYLE_UNDERLINE = 4
+
+
+def _font_xml(style_id: int) -> str:
+    parts = ["<font>"]
+    parts.append('<b val="1"/>' if style_id & STYLE_BOLD else '<b val="0"/>')
+    parts.append('<i val="1"/>' if style_id & STYLE_ITALIC else '<i val="0"/>')
+    if style_id & STYLE_UNDERLINE:
+        parts.append('<u val="single"/>')
+    parts.append('<sz val="11"/><color theme="1"/><name val="Calibri"/>'
+                 '<family val="2"/><scheme val="minor"/></font>')
+    return "".join(parts)
+
+
+STYLES_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    f'<styleSheet xmlns="{SHEET_MAIN_NS}">'
+    '<fonts count="8">' + "".join(_font_xml(i) for i in range(8)) + '</fonts>'
+    '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="8">'
+    + '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    + "".join(
+        f'<xf numFmtId="0" fontId="{i}" fillId="0" borderId="0" xfId="0" applyFont="1"/>'
+        for i in range(1, 8)
+    )
+    + '</cellXfs>'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    '</styleSheet>'
+)
+
+
+def _content_types_xml(sheet_count: int) -> str:
+    overrides = "".join(
+        f'<Override PartName="/xl/worksheets/sheet{i}.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        for i in range(1, sheet_count + 1)
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/styles.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+        f'{overrides}</Types>'
+    )
+
+
+def _escape_attr(value: str) -> str:
+    return (
+        value.replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace(">", "&gt;")
+        .replace('"', "&quot;")
+    )
+
+
+def _workbook_xml(sheet_names: list[str]) -> str:
+    sheets = "".join(
+        f'<sheet name="{_escape_attr(name)}" sheetId="{i}" r:id="rId{i}"/>'
+        for i, name in enumerate(sheet_names, 1)
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        f'<workbook xmlns="{SHEET_MAIN_NS}" xmlns:r="{REL_NS}">'
+        f'<sheets>{sheets}</sheets>'
+        '<calcPr calcId="124519" fullCalcOnLoad="1"/>'
+        '</workbook>'
+    )
+
+
+def _workbook_rels_xml(sheet_count: int) -> str:
+    rels = "".join(
+        f'<Relationship Id="rId{i}" Type="{REL_NS}/worksheet" '
+        f'Target="worksheets/sheet{i}.xml"/>'
+        for i in range(1, sheet_count + 1)
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        f'<Relationships xmlns="{PKG_REL_NS}">{rels}'
+        f'<Relationship Id="rId{sheet_count + 1}" Type="{REL_NS}/styles" '
+        'Target="styles.xml"/>'
+        '</Relationships>'
+    )
+
+
+# ============================================================
+# Sheet titles
+# ============================================================
+
+def unique_sheet_title(title: str, existing: list[str]) -> str:
+    """
+    Validate a sheet title and make it unique within the workbook.
+
+    Duplicate titles (compared case-insensitively, as Excel does) get a
+    numeric suffix: 'Data', 'Data1', 'Data2', ... A title already at the
+    31-character limit is shortened to make room for its suffix.
+
+    Raises:
+        ValueError: If the title contains a character Excel forbids or is
+            longer than 31 characters
+    """
+    for ch in title:
+        if ch in INVALID_TITLE_CHARS:
+            raise ValueError(f"Invalid character {ch} found in sheet title")
+    if len(title) > MAX_TITLE_LENGTH:
+        raise ValueError(f"Sheet title '{title}' is longer than {MAX_TITLE_LENGTH} characters")
+
+    taken = {name.lower() for name in existing}
+    if title.lower() not in taken:
+        return title
+
+    counter = 1
+    while True:
+        suffix = str(counter)
+        candidate = title[:MAX_TITLE_LENGTH - len(suffix)] + suffix
+        if candidate.lower() not in taken:
+            return candidate
+        counter += 1
+
+
+# ============================================================
+# Cell emission
+# ============================================================
+
+def _cell_element(ref: str, value, style_id: int):
+    """Build a <c> element for one cell value."""
+    c = Element("c", r=ref)
+    if style_id:
+        c.set("s", str(style_id))
+
+    if value is None or value == "":
+        return c
+
+    if value is True or value is False:
+        c.set("t", "b")
+        SubElement(c, "v").text = "1" if value else "0"
+    elif isinstance(value, (int, float)):
+        # inf/nan have no SpreadsheetML form; leave the cell empty, as
+        # openpyxl did
+        if isinstance(value, float) and not math.isfinite(value):
+            return c
+        SubElement(c, "v").text = "%.16g" % value
+    elif value.startswith("=") and len(value) > 1:
+        SubElement(c, "f").text = value[1:]
+        SubElement(c, "v")
+    else:
+        c.set("t", "inlineStr")
+        t = SubElement(SubElement(c, "is"), "t")
+        t.text = value
+        if value != value.strip():
+            t.set("{http://www.w3.org/XML/1998/namespace}space", "preserve")
+    return c
+
+
+@contextmanager
+def _worksheet(fh, merges=()):
+    """Write a <worksheet> document to fh, yielding inside <sheetData>."""
+    with xmlfile(fh, encoding="utf-8") as xf:
+        with xf.element("worksheet", xmlns=SHEET_MAIN_NS):
+            with xf.element("sheetData"):
+                yield xf
+            if merges:
+                block = Element("mergeCells", count=str(len(merges)))
+                for r1, c1, r2, c2 in merges:
+                    SubElement(
+                        block, "mergeCell",
+                        ref=f"{COL_LETTERS[c1]}{r1}:{COL_LETTERS[c2]}{r2}",
+                    )
+                xf.write(block)
+
+
+@contextmanager
+def open_sheet(archive: zipfile.ZipFile, sheet_id: int, merges=()):
+    """
+    Open worksheet part xl/worksheets/sheet<sheet_id>.xml for streaming.
+
+    Yields the incremental writer positioned inside <sheetData>; rows
+    written to it go straight into the compressed archive entry. Merged
+    ranges, given as (start_row, start_col, end_row, end_col) tuples,
+    are written after the sheet data when the context exits.
+    """
+    with archive.open(f"xl/worksheets/sheet{sheet_id}.xml", "w") as fh:
+        with _worksheet(fh, merges) as xf:
+            yield xf
+
+
+def render_sheet(cells: dict, styles: dict, merges: list) -> bytes:
+    """
+    Serialise one worksheet part to bytes.
+
+    Used when sheets are rendered in worker processes; the bytes can be
+    passed to write_workbook() in place of the (cells, styles, merges)
+    buffers.
+    """
+    buffer = io.BytesIO()
+    with _worksheet(buffer, merges) as xf:
+        write_sheet_data(xf, cells, styles)
+    return buffer.getvalue()
+
+
+def write_sheet_data(xf, cells: dict, styles: dict) -> None:
+    """
+    Emit one <row> element per populated row, in row/column order.
+
+    Args:
+        xf: Incremental writer yielded by open_sheet()
+        cells: Mapping of row -> {col: value}
+        styles: Mapping of row -> {col: style id}
+    """
+    no_cells: dict = {}
+    for row in sorted(cells.keys() | styles.keys()):
+        row_cells = cells.get(row, no_cells)
+        row_styles = styles.get(row, no_cells)
+        if not row_cells and not row_styles:
+            continue
+        row_el = Element("row", r=str(row))
+        suffix = str(row)
+        for col in sorted(row_cells.keys() | row_styles.keys()):
+            row_el.append(
+                _cell_element(COL_LETTERS[col] + suffix, row_cells.get(col), row_styles.get(col, 0))
+            )
+        xf.write(row_el)
+
+
+def write_workbook(output_path: str | Path | BinaryIO, sheets: list) -> None:
+    """
+    Write a complete .xlsx package.
+
+    Args:
+        output_path: Destination file path or writable binary file object
+        sheets: List of (title, content) pairs, one per sheet, where content
+            is either a (cells, styles, merges) tuple, streamed into the
+            archive, or worksheet XML already produced by render_sheet()
+
+    Raises:
+        ValueError: If the workbook has no sheets
+    """
+    if not sheets:
+        raise ValueError("Workbook must contain at least one xsheet")
+
+    titles = [title for title, _ in sheets]
+    with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("[Content_Types].xml", _content_types_xml(len(sheets)))
+        archive.writestr("_rels/.rels", ROOT_RELS_XML)
+        archive.writestr("xl/workbook.xml", _workbook_xml(titles))
+        archive.writestr("xl/_rels/workbook.xml.rels", _workbook_rels_xml(len(sheets)))
+        archive.writestr("xl/styles.xml", STYLES_XML)
+
+        for sheet_id, (_, content) in enumerate(sheets, 1):
+            if isinstance(content, bytes):
+                archive.writestr(f"xl/worksheets/sheet{sheet_id}.xml", content)
+                continue
+            cells, styles, merges = content
+            with open_sheet(archive, sheet_id, merges) as xf:
+                write_sheet_data(xf, cells, styles)
@@ -0,0 +1,107 @@
+# ============================================================
+# exlang.xlsxwriter_backend: optional XlsxWriter output backend
+# ============================================================
+
+import math
+from pathlib import Path
+from typing import BinaryIO
+
+from .xlsx_writer import STYLE_BOLD, STYLE_ITALIC, STYLE_UNDERLINE
+
+
+def write_workbook(output_path: str | Path | BinaryIO, sheets: list) -> None:
+    """
+    Write a complete .xlsx package with XlsxWriter.
+
+    Drop-in alternative to exlang.xlsx_writer.write_workbook(), selected with
+    compile_xlang_to_xlsx(..., backend="xlsxwriter").
+
+    Args:
+        output_path: Destination file path or writable binary file object
+        sheets: List of (title, (cells, styles, merges)) pairs, one per sheet
+
+    Raises:
+        ImportError: If XlsxWriter is not installed
+        FileNotFoundError: If the output directory does not exist
+        ValueError: If the workbook has no sheets
+    """
+    try:
+        import xlsxwriter
+    except ImportError as e:
+        raise ImportError(
+            "The 'xlsxwriter' backend requires XlsxWriter: pip install exlang[xlsxwriter]"
+        ) from e
+
+    if not sheets:
+        raise ValueError("Workbook must contain at least one xsheet")
+
+    # constant_memory flushes each row as soon as the next one starts, which
+    # suits the row-ordered buffers; merge_range() writes across rows, so
+    # workbooks with merged cells are built in memory instead
+    has_merges = any(merges for _, (_, _, merges) in sheets)
+    if isinstance(output_path, Path):
+        output_path = str(output_path)
+    workbook = xlsxwriter.Workbook(output_path, {"constant_memory": not has_merges})
+
+    # Indexed by style id, like the built-in writer's font table
+    formats = [None] + [
+        workbook.add_format({
+            "bold": bool(style_id & STYLE_BOLD),
+            "italic": bool(style_id & STYLE_ITALIC),
+            "underline": 1 if style_id & STYLE_UNDERLINE else 0,
+        })
+        for style_id in range(1, 8)
+    ]
+    for title, (cells, styles, merges) in sheets:
+        _write_sheet(workbook.add_worksheet(title), cells, styles, merges, formats)
+
+    # Nothing is written to output_path until close()
+    try:
+        workbook.close()
+    except xlsxwriter.exceptions.FileCreateError as e:
+        # Surface a missing directory as FileNotFoundError, like the built-in
+        # writer, so the compiler's recreate-and-retry path applies
+        error = e.args[0] if e.args else None
+        if isinstance(error, FileNotFoundError):
+            raise error from e
+        raise
+
+
+def _write_sheet(worksheet, cells: dict, styles: dict, merges: list, formats: list) -> None:
+    """Write one sheet's buffers; rows and columns are 1-based, XlsxWriter's 0-based."""
+    no_cells: dict = {}
+
+    # Merged ranges first; the anchor value is written with the other cells below
+    for r1, c1, r2, c2 in merges:
+        fmt = formats[styles.get(r1, no_cells).get(c1, 0)]
+        worksheet.merge_range(r1 - 1, c1 - 1, r2 - 1, c2 - 1, None, fmt)
+
+    write_blank = worksheet.write_blank
+    for row in sorted(cells.keys() | styles.keys()):
+        row_cells = cells.get(row, no_cells)
+        row_styles = styles.get(row, no_cells)
+        for col in sorted(row_cells.keys() | row_styles.keys()):
+            value = row_cells.get(col)
+            fmt = formats[row_styles.get(col, 0)]
+            if value is None or value == "":
+                if fmt is not None:
+                    write_blank(row - 1, col - 1, None, fmt)
+            else:
+                _write_value(worksheet, row - 1, col - 1, value, fmt)
+
+
+def _write_value(worksheet, row: int, col: int, value, fmt) -> None:
+    """Write a non-empty value with the typed XlsxWriter method."""
+    if value is True or value is False:
+        worksheet.write_boolean(row, col, value, fmt)
+    elif isinstance(value, (int, float)):
+        if isinstance(value, float) and not math.isfinite(value):
+            # inf/nan are left empty, as the built-in writer does
+            if fmt is not None:
+                worksheet.write_blank(row, col, None, fmt)
+        else:
+            worksheet.write_number(row, col, value, fmt)
+    elif value.startswith("=") and len(value) > 1:
+        worksheet.write_formula(row, col, value, fmt)
+    else:
+        worksheet.write_string(row, col, value, fmt)
@@ -1 +1,16 @@
 # tests package
+
+from functools import lru_cache
+
+from exlang._xml import fromstring
+
+
+@lru_cache(maxsize=None)
+def parse_xlang(xlang: str):
+    """
+    Parse an exlang snippet once per unique string.
+
+    The cached tree is shared between tests, which is safe because
+    validate_xlang_minimal() never modifies the tree it inspects.
+    """
+    return fromstring(xlang)
@@ -0,0 +1,31 @@
+# ============================================================
+# tests.conftest: shared fixtures
+# ============================================================
+
+import io
+
+import pytest
+
+from exlang import compile_xlang_to_xlsx
+
+
+@pytest.fixture(scope="session")
+def compiled_xlsx():
+    """
+    Compile each unique xlang document once per session, in memory.
+
+    Returns a function mapping an xlang string to a fresh io.BytesIO over
+    its compiled workbook, ready for load_workbook(). Each call gets its own
+    buffer, so tests never share file positions and nothing touches disk.
+    """
+    cache = {}
+
+    def compile_once(xlang):
+        data = cache.get(xlang)
+        if data is None:
+            buffer = io.BytesIO()
+            compile_xlang_to_xlsx(xlang, buffer)
+            data = cache[xlang] = buffer.getvalue()
+        return io.BytesIO(data)
+
+    return compile_once
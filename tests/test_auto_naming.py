@@ -5,10 +5,11 @@
 import pytest
 from openpyxl import load_workbook
 from pathlib import Path
-from xml.etree import ElementTree as ET
 
 from exlang import compile_xlang_to_xlsx, validate_xlang_minimal
 
+from tests import parse_xlang
+
 
 # ============================================================
 # Basic Auto-Naming Tests
@@ -125,7 +126,7 @@ def test_collision_sheet1_explicit(tmp_path):
       <xsheet name="Sheet1"></xsheet>
     </xworkbook>
     """
-    root = ET.fromstring(xlang)
+    root = parse_xlang(xlang)
     errors = validate_xlang_minimal(root)
     
     assert len(errors) == 1
@@ -142,7 +143,7 @@ def test_collision_sheet2_explicit(tmp_path):
       <xsheet name="Sheet2"></xsheet>
     </xworkbook>
     """
-    root = ET.fromstring(xlang)
+    root = parse_xlang(xlang)
     errors = validate_xlang_minimal(root)
     
     assert len(errors) == 1
@@ -161,7 +162,7 @@ def test_collision_multiple_conflicts(tmp_path):
       <xsheet name="Sheet3"></xsheet>
     </xworkbook>
     """
-    root = ET.fromstring(xlang)
+    root = parse_xlang(xlang)
     errors = validate_xlang_minimal(root)
     
     assert len(errors) == 2
@@ -179,7 +180,7 @@ def test_no_collision_different_names(tmp_path):
       <xsheet name="Summary"></xsheet>
     </xworkbook>
     """
-    root = ET.fromstring(xlang)
+    root = parse_xlang(xlang)
     errors = validate_xlang_minimal(root)
     
     assert len(errors) == 0
@@ -194,7 +195,7 @@ def test_no_collision_all_unnamed(tmp_path):
       <xsheet></xsheet>
     </xworkbook>
     """
-    root = ET.fromstring(xlang)
+    root = parse_xlang(xlang)
     errors = validate_xlang_minimal(root)
     
     assert len(errors) == 0
@@ -209,7 +210,7 @@ def test_no_collision_all_named(tmp_path):
       <xsheet name="Report"></xsheet>
     </xworkbook>
     """
-    root = ET.fromstring(xlang)
+    root = parse_xlang(xlang)
     errors = validate_xlang_minimal(root)
     
     assert len(errors) == 0
@@ -0,0 +1,165 @@
+# ============================================================
+# tests.test_backends: workbook writer backend selection
+# ============================================================
+
+import importlib.util
+import io
+
+import pytest
+from openpyxl import load_workbook
+
+from exlang import compile_xlang_to_xlsx
+
+
+requires_xlsxwriter = pytest.mark.skipif(
+    importlib.util.find_spec("xlsxwriter") is None,
+    reason="XlsxWriter is not installed",
+)
+
+# Every backend, skipping the optional ones that are not installed
+ALL_BACKENDS = ["builtin", pytest.param("xlsxwriter", marks=requires_xlsxwriter)]
+
+XLANG = """
+<xworkbook>
+  <xsheet name="Data">
+    <xrow r="1"><xv>Name</xv><xv>Score</xv><xv>Passed</xv></xrow>
+    <xrepeat times="3" r="2" c="A"><xv>Item {{i}}</xv><xv>{{i0}}.5</xv><xv>true</xv></xrepeat>
+    <xcell addr="D2" v="=SUM(B2:B4)"/>
+    <xcell addr="E2" v="  padded  "/>
+    <xrange from="A6" to="C7" fill="0"/>
+    <xstyle addr="A1:C1" bold="true" underline="true"/>
+    <xstyle addr="D2" italic="true"/>
+  </xsheet>
+  <xsheet name="Merged">
+    <xrow r="1"><xv>Title</xv><xv>Hidden</xv></xrow>
+    <xmerge addr="A1:C2"/>
+    <xstyle addr="A1" bold="true"/>
+  </xsheet>
+</xworkbook>
+"""
+
+
+def _snapshot(path):
+    wb = load_workbook(path)
+    return {
+        ws.title: (
+            [
+                [(c.value, c.font.b, c.font.i, c.font.u) for c in row]
+                for row in ws.iter_rows(max_row=7, max_col=5)
+            ],
+            sorted(str(r) for r in ws.merged_cells.ranges),
+        )
+        for ws in wb.worksheets
+    }
+
+
+# ============================================================
+# Backend selection tests
+# ============================================================
+
+class TestBackendSelection:
+    """Test backend argument handling."""
+
+    def test_unknown_backend(self, tmp_path):
+        """An unknown backend name raises ValueError before compiling."""
+        with pytest.raises(ValueError, match="Unknown backend 'csv'"):
+            compile_xlang_to_xlsx(XLANG, tmp_path / "out.xlsx", backend="csv")
+
+    def test_workers_require_builtin(self, tmp_path):
+        """Parallel workers render with the built-in writer only."""
+        with pytest.raises(ValueError, match="requires the 'builtin' backend"):
+            compile_xlang_to_xlsx(
+                XLANG, tmp_path / "out.xlsx", workers=2, backend="xlsxwriter"
+            )
+
+
+# ============================================================
+# Sheet title tests
+# ============================================================
+
+class TestSheetTitles:
+    """Test that every backend applies the same sheet title rules."""
+
+    @pytest.mark.parametrize("backend", ALL_BACKENDS)
+    def test_long_title_rejected(self, tmp_path, backend):
+        """Titles over 31 characters fail the same way on every backend."""
+        xlang = f'<xworkbook><xsheet name="{"x" * 32}"/></xworkbook>'
+        output = tmp_path / "long.xlsx"
+
+        with pytest.raises(ValueError, match="longer than 31 characters"):
+            compile_xlang_to_xlsx(xlang, output, backend=backend)
+        assert not output.exists()
+
+    @pytest.mark.parametrize("backend", ALL_BACKENDS)
+    def test_duplicate_title_at_limit(self, tmp_path, backend):
+        """A duplicated 31-character title is shortened to fit its suffix."""
+        title = "x" * 31
+        xlang = f'<xworkbook><xsheet name="{title}"/><xsheet name="{title}"/></xworkbook>'
+        output = tmp_path / "dupes.xlsx"
+        compile_xlang_to_xlsx(xlang, output, backend=backend)
+
+        assert load_workbook(output).sheetnames == [title, "x" * 30 + "1"]
+
+
+# ============================================================
+# XlsxWriter backend tests
+# ============================================================
+
+@requires_xlsxwriter
+class TestXlsxWriterBackend:
+    """Test that the XlsxWriter backend matches the built-in writer."""
+
+    def test_matches_builtin(self, tmp_path):
+        """Values, fonts and merges match the built-in output."""
+        builtin_out = tmp_path / "builtin.xlsx"
+        compile_xlang_to_xlsx(XLANG, builtin_out)
+        xlsxwriter_out = tmp_path / "xlsxwriter.xlsx"
+        compile_xlang_to_xlsx(XLANG, xlsxwriter_out, backend="xlsxwriter")
+
+        assert _snapshot(xlsxwriter_out) == _snapshot(builtin_out)
+
+    def test_constant_memory_without_merges(self, tmp_path):
+        """Workbooks without merges are streamed row by row."""
+        xlang = """
+        <xworkbook>
+          <xsheet name="Rows">
+            <xrepeat times="100" r="1" c="A"><xv>{{i}}</xv><xv>Row {{i}}</xv></xrepeat>
+            <xcell addr="C50" v="x"/>
+          </xsheet>
+        </xworkbook>
+        """
+        output = tmp_path / "rows.xlsx"
+        compile_xlang_to_xlsx(xlang, output, backend="xlsxwriter")
+
+        ws = load_workbook(output)["Rows"]
+        assert ws["A100"].value == 100
+        assert ws["B1"].value == "Row 1"
+        assert ws["C50"].value == "x"
+
+    def test_non_finite_numbers_match_builtin(self, tmp_path):
+        """inf and nan are left empty by both backends."""
+        xlang = """
+        <xworkbook>
+          <xsheet name="NonFinite">
+            <xcell addr="A1" v="inf" t="number"/>
+            <xcell addr="A2" v="nan" t="number"/>
+            <xcell addr="A3" v="2" t="number"/>
+            <xstyle addr="A1" bold="true"/>
+          </xsheet>
+        </xworkbook>
+        """
+        builtin_out = tmp_path / "builtin.xlsx"
+        compile_xlang_to_xlsx(xlang, builtin_out)
+        xlsxwriter_out = tmp_path / "xlsxwriter.xlsx"
+        compile_xlang_to_xlsx(xlang, xlsxwriter_out, backend="xlsxwriter")
+
+        assert _snapshot(xlsxwriter_out) == _snapshot(builtin_out)
+        assert load_workbook(xlsxwriter_out)["NonFinite"]["A1"].value is None
+
+    def test_file_object_output(self):
+        """The XlsxWriter backend also writes to binary file objects."""
+        buffer = io.BytesIO()
+        compile_xlang_to_xlsx(XLANG, buffer, backend="xlsxwriter")
+
+        buffer.seek(0)
+        assert load_workbook(buffer)["Merged"]["A1"].value == "Title"
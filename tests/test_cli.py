@@ -3,6 +3,8 @@ Tests for the CLI interface.
 """
 
 import json
+import subprocess
+import sys
 from pathlib import Path
 from click.testing import CliRunner
 import pytest
@@ -266,3 +268,15 @@ def test_validate_help(runner):
     assert result.exit_code == 0
     assert "input-files" in result.output.lower() or "INPUT_FILES" in result.output
     assert "--format" in result.output
+
+
+def test_cli_import_skips_compiler():
+    """Importing the CLI (e.g. for validate only) does not load the compiler."""
+    code = (
+        "import sys, exlang.cli; "
+        "print('exlang.compiler' in sys.modules, 'exlang.xlsx_writer' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.split() == ["False", "False"]
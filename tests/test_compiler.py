@@ -145,6 +145,28 @@ class TestValueTypes:
         assert ws["A3"].value is True
         assert ws["A4"].value is False
 
+    def test_non_finite_numbers_left_empty(self, tmp_path):
+        """inf and nan cannot be stored in a cell and are written as empty cells."""
+        xlang = """
+        <xworkbook>
+          <xsheet name="NonFinite">
+            <xcell addr="A1" v="inf" t="number"/>
+            <xcell addr="A2" v="-inf" t="number"/>
+            <xcell addr="A3" v="nan" t="number"/>
+            <xcell addr="A4" v="1.5" t="number"/>
+          </xsheet>
+        </xworkbook>
+        """
+        output = tmp_path / "non_finite.xlsx"
+        compile_xlang_to_xlsx(xlang, output)
+
+        ws = load_workbook(output)["NonFinite"]
+
+        assert ws["A1"].value is None
+        assert ws["A2"].value is None
+        assert ws["A3"].value is None
+        assert ws["A4"].value == 1.5
+
 
 # ============================================================
 # Row-based placement tests
@@ -299,3 +321,247 @@ class TestMixedPlacement:
         assert ws["B2"].value == "Value2"
         assert ws["A4"].value == "Total"
         assert ws["B4"].value == "=SUM(B2:B3)"
+
+    def test_absolute_xcell_address(self, tmp_path):
+        """$-anchored addresses place the cell like their relative form."""
+        xlang = '<xworkbook><xsheet name="Abs"><xcell addr="$B$3" v="7"/></xsheet></xworkbook>'
+        output = tmp_path / "absolute.xlsx"
+        compile_xlang_to_xlsx(xlang, output)
+
+        assert load_workbook(output)["Abs"]["B3"].value == 7
+
+
+# ============================================================
+# Streaming (large input) compilation tests
+# ============================================================
+
+class TestStreamingCompile:
+    """Test the incremental per-sheet path used for large inputs."""
+
+    XLANG = """
+    <xworkbook>
+      <xsheet name="Data">
+        <xrow r="1"><xv>Name</xv><xv>Score</xv></xrow>
+        <xrange from="B2" to="B4" fill="0"/>
+        <xrepeat times="3" r="2" c="A"><xv>Item {{i}}</xv></xrepeat>
+        <xcell addr="B3" v="42"/>
+        <xmerge addr="D1:E1"/>
+        <xstyle addr="A1:B1" bold="true"/>
+      </xsheet>
+      <xsheet>
+        <xcell addr="A1" v="=Data!B3"/>
+      </xsheet>
+    </xworkbook>
+    """
+
+    @staticmethod
+    def _snapshot(path):
+        wb = load_workbook(path)
+        return {
+            ws.title: (
+                [[(c.value, c.font.bold) for c in row] for row in ws.iter_rows()],
+                sorted(str(r) for r in ws.merged_cells.ranges),
+            )
+            for ws in wb.worksheets
+        }
+
+    def test_stream_matches_tree(self, tmp_path, monkeypatch):
+        """Streaming and whole-tree compilation produce the same workbook."""
+        tree_out = tmp_path / "tree.xlsx"
+        compile_xlang_to_xlsx(self.XLANG, tree_out)
+
+        monkeypatch.setattr("exlang.compiler.STREAM_THRESHOLD", 0)
+        stream_out = tmp_path / "stream.xlsx"
+        compile_xlang_to_xlsx(self.XLANG, stream_out)
+
+        assert self._snapshot(stream_out) == self._snapshot(tree_out)
+
+    def test_stream_reports_all_errors(self, tmp_path, monkeypatch):
+        """Errors from every sheet, including name collisions, are raised."""
+        monkeypatch.setattr("exlang.compiler.STREAM_THRESHOLD", 0)
+        xlang = """
+        <xworkbook>
+          <xsheet><xrow><xv>A</xv></xrow></xsheet>
+          <xsheet name="Sheet1"><xcell v="1"/></xsheet>
+        </xworkbook>
+        """
+        output = tmp_path / "invalid.xlsx"
+
+        with pytest.raises(ValueError) as excinfo:
+            compile_xlang_to_xlsx(xlang, output)
+        message = str(excinfo.value)
+        assert "conflicts" in message
+        assert "xrow missing required attribute 'r'" in message
+        assert "xcell missing required attribute 'addr'" in message
+        assert not output.exists()
+
+    def test_stream_invalid_root(self, tmp_path, monkeypatch):
+        """A wrong root tag is rejected before any sheet is read."""
+        monkeypatch.setattr("exlang.compiler.STREAM_THRESHOLD", 0)
+
+        with pytest.raises(ValueError, match="Root tag must be 'xworkbook'"):
+            compile_xlang_to_xlsx("<workbook><xsheet/></workbook>", tmp_path / "x.xlsx")
+
+
+# ============================================================
+# Parallel compilation tests
+# ============================================================
+
+class TestParallelCompile:
+    """Test compiling sheets in worker processes."""
+
+    XLANG = TestStreamingCompile.XLANG
+    _snapshot = staticmethod(TestStreamingCompile._snapshot)
+
+    @pytest.mark.parametrize("threshold", [64 * 1024, 0])
+    def test_workers_match_serial(self, tmp_path, monkeypatch, threshold):
+        """Worker-rendered sheets match in-process output (tree and stream paths)."""
+        monkeypatch.setattr("exlang.compiler.STREAM_THRESHOLD", threshold)
+
+        serial_out = tmp_path / "serial.xlsx"
+        compile_xlang_to_xlsx(self.XLANG, serial_out)
+        parallel_out = tmp_path / "parallel.xlsx"
+        compile_xlang_to_xlsx(self.XLANG, parallel_out, workers=2)
+
+        assert self._snapshot(parallel_out) == self._snapshot(serial_out)
+
+    def test_workers_report_errors(self, tmp_path):
+        """Validation errors are raised before any sheet reaches a worker."""
+        output = tmp_path / "bad.xlsx"
+        with pytest.raises(ValueError, match="xrow missing required attribute 'r'"):
+            compile_xlang_to_xlsx(
+                "<xworkbook><xsheet><xrow/></xsheet></xworkbook>", output, workers=2
+            )
+        assert not output.exists()
+
+
+# ============================================================
+# Validation option tests
+# ============================================================
+
+class TestValidationOptions:
+    """Test skipping and memoizing validation."""
+
+    XLANG = '<xworkbook><xsheet name="S"><xcell addr="A1" v="7"/></xsheet></xworkbook>'
+    # Fails validation (unknown type hint) but still compiles: the compiler
+    # falls back to automatic inference. Whether a compile succeeds shows
+    # whether the validator ran, without patching module functions (which
+    # has no effect on a mypyc build).
+    UNCHECKED_XLANG = '<xworkbook><xsheet name="S"><xcell addr="A1" v="7" t="bogus"/></xsheet></xworkbook>'
+
+    @staticmethod
+    def _fresh_memo(monkeypatch):
+        import exlang.compiler as compiler
+
+        memo = {}
+        monkeypatch.setattr(compiler, "_VALIDATED", memo)
+        return memo
+
+    def test_validate_false_skips_checks(self, tmp_path, monkeypatch):
+        """validate=False compiles without running the validator."""
+        self._fresh_memo(monkeypatch)
+        with pytest.raises(ValueError, match="invalid type hint"):
+            compile_xlang_to_xlsx(self.UNCHECKED_XLANG, tmp_path / "checked.xlsx")
+
+        output = tmp_path / "trusted.xlsx"
+        compile_xlang_to_xlsx(self.UNCHECKED_XLANG, output, validate=False)
+        assert load_workbook(output)["S"]["A1"].value == 7
+
+    def test_repeat_compile_validates_once(self, tmp_path, monkeypatch):
+        """A document that passed validation is not validated again."""
+        memo = self._fresh_memo(monkeypatch)
+        compile_xlang_to_xlsx(self.XLANG, tmp_path / "a.xlsx")
+        assert list(memo) == [self.XLANG]
+
+        # A memo hit skips the validator, so even a document that would fail
+        # it compiles
+        memo[self.UNCHECKED_XLANG] = None
+        compile_xlang_to_xlsx(self.UNCHECKED_XLANG, tmp_path / "b.xlsx")
+        assert (tmp_path / "b.xlsx").exists()
+
+    def test_concurrent_compiles(self, monkeypatch):
+        """Compiles from several threads share the memo safely while it evicts."""
+        import io
+        from concurrent.futures import ThreadPoolExecutor
+
+        monkeypatch.setattr("exlang.compiler._VALIDATED", {})
+        monkeypatch.setattr("exlang.compiler.VALIDATION_MEMO_SIZE", 2)
+
+        def compile_value(n):
+            buffer = io.BytesIO()
+            compile_xlang_to_xlsx(self.XLANG.replace('v="7"', f'v="{n}"'), buffer)
+            buffer.seek(0)
+            return load_workbook(buffer)["S"]["A1"].value
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            assert list(pool.map(compile_value, range(64))) == list(range(64))
+
+    def test_large_document_not_memoized(self, monkeypatch):
+        """Documents large enough to stream are not kept alive by the memo."""
+        import io
+        import exlang.compiler as compiler
+
+        memo = self._fresh_memo(monkeypatch)
+        monkeypatch.setattr(compiler, "STREAM_THRESHOLD", len(self.XLANG))
+        for _ in range(2):
+            compile_xlang_to_xlsx(self.XLANG, io.BytesIO())
+
+        assert memo == {}
+
+    def test_invalid_document_not_memoized(self, tmp_path, monkeypatch):
+        """A document that failed validation is rejected every time."""
+        memo = self._fresh_memo(monkeypatch)
+        xlang = "<xworkbook><xsheet><xrow/></xsheet></xworkbook>"
+        for _ in range(2):
+            with pytest.raises(ValueError, match="Invalid XLang"):
+                compile_xlang_to_xlsx(xlang, tmp_path / "bad.xlsx")
+        assert memo == {}
+
+
+# ============================================================
+# Output path tests
+# ============================================================
+
+class TestOutputPath:
+    """Test output directory handling."""
+
+    XLANG = '<xworkbook><xsheet name="S"><xcell addr="A1" v="1"/></xsheet></xworkbook>'
+
+    def test_creates_missing_directories(self, tmp_path):
+        """Missing parent directories are created."""
+        output = tmp_path / "a" / "b" / "out.xlsx"
+        compile_xlang_to_xlsx(self.XLANG, output)
+        assert output.exists()
+
+    def test_directory_removed_between_compiles(self, tmp_path):
+        """A cached output directory that was deleted is recreated."""
+        import shutil
+
+        out_dir = tmp_path / "batch"
+        compile_xlang_to_xlsx(self.XLANG, out_dir / "first.xlsx")
+        shutil.rmtree(out_dir)
+
+        compile_xlang_to_xlsx(self.XLANG, out_dir / "second.xlsx")
+        assert (out_dir / "second.xlsx").exists()
+
+    def test_directory_removed_between_compiles_xlsxwriter(self, tmp_path):
+        """The XlsxWriter backend also recreates a deleted output directory."""
+        import shutil
+
+        pytest.importorskip("xlsxwriter")
+        out_dir = tmp_path / "batch"
+        compile_xlang_to_xlsx(self.XLANG, out_dir / "first.xlsx", backend="xlsxwriter")
+        shutil.rmtree(out_dir)
+
+        compile_xlang_to_xlsx(self.XLANG, out_dir / "second.xlsx", backend="xlsxwriter")
+        assert (out_dir / "second.xlsx").exists()
+
+    def test_file_object_output(self):
+        """A binary file object receives the package; nothing is written to disk."""
+        import io
+
+        buffer = io.BytesIO()
+        compile_xlang_to_xlsx(self.XLANG, buffer)
+
+        buffer.seek(0)
+        assert load_workbook(buffer)["S"]["A1"].value == 1
@@ -4,7 +4,7 @@
 
 import pytest
 from pathlib import Path
-from xml.etree import ElementTree as ET
+from exlang._xml import ParseError, fromstring
 from exlang import compile_xlang_to_xlsx, validate_xlang_minimal
 
 
@@ -85,11 +85,11 @@ class TestXMLParsingErrors:
     """Test that malformed XML is caught early."""
 
     def test_malformed_xml(self, tmp_path):
-        """Malformed XML raises ET.ParseError."""
+        """Malformed XML raises ParseError."""
         xlang = "<xworkbook><xsheet name='Test'>"  # Missing closing tag
         output = tmp_path / "invalid.xlsx"
 
-        with pytest.raises(ET.ParseError):
+        with pytest.raises(ParseError):
             compile_xlang_to_xlsx(xlang, output)
 
     def test_empty_string(self, tmp_path):
@@ -97,7 +97,7 @@ class TestXMLParsingErrors:
         xlang = ""
         output = tmp_path / "invalid.xlsx"
 
-        with pytest.raises(ET.ParseError):
+        with pytest.raises(ParseError):
             compile_xlang_to_xlsx(xlang, output)
 
     def test_whitespace_only(self, tmp_path):
@@ -105,7 +105,7 @@ class TestXMLParsingErrors:
         xlang = "   \n\n   "
         output = tmp_path / "invalid.xlsx"
 
-        with pytest.raises(ET.ParseError):
+        with pytest.raises(ParseError):
             compile_xlang_to_xlsx(xlang, output)
 
 
@@ -144,6 +144,53 @@ class TestRuntimeErrors:
         with pytest.raises(ValueError):
             compile_xlang_to_xlsx(xlang, output)
 
+    @pytest.mark.parametrize("addr", ["XFE1", "ZZZZ1"])
+    def test_column_past_xfd(self, tmp_path, addr):
+        """Cell addresses past column XFD raise ValueError."""
+        xlang = f"""
+        <xworkbook>
+          <xsheet name="Data">
+            <xcell addr="{addr}" v="1"/>
+          </xsheet>
+        </xworkbook>
+        """
+        output = tmp_path / "invalid.xlsx"
+
+        with pytest.raises(ValueError, match="Column out of range"):
+            compile_xlang_to_xlsx(xlang, output)
+
+    @pytest.mark.parametrize("element,message", [
+        ('<xcell addr="A0" v="1"/>', "Row out of range in xcell: 0"),
+        ('<xcell addr="A1048577" v="1"/>', "Row out of range in xcell: 1048577"),
+        ('<xrow r="0"><xv>x</xv></xrow>', "Row out of range in xrow: 0"),
+        ('<xrow r="-1"><xv>x</xv></xrow>', "Row out of range in xrow: -1"),
+        ('<xrow r="1" c="XFD"><xv>x</xv><xv>y</xv></xrow>', "Column out of range in xrow: 16385"),
+        ('<xrepeat times="2" r="0"><xv>x</xv></xrepeat>', "Row out of range in xrepeat: 0"),
+        ('<xrepeat times="3" r="1048575"><xv>x</xv></xrepeat>', "Row out of range in xrepeat: 1048577"),
+        ('<xrepeat times="2" r="1" c="XFD" direction="right"><xv>x</xv></xrepeat>',
+         "Column out of range in xrepeat: 16385"),
+        ('<xrange from="A0" to="B1" fill="0"/>', "Row out of range in xrange: 0"),
+        ('<xmerge addr="A1:B1048577"/>', "Row out of range in xmerge: 1048577"),
+        ('<xstyle addr="A0" bold="true"/>', "Row out of range in xstyle: 0"),
+    ])
+    def test_cell_outside_worksheet(self, tmp_path, element, message):
+        """Cells past A1:XFD1048576 raise ValueError before any output is written."""
+        xlang = f"<xworkbook><xsheet name='Data'>{element}</xsheet></xworkbook>"
+        output = tmp_path / "invalid.xlsx"
+
+        with pytest.raises(ValueError, match=message):
+            compile_xlang_to_xlsx(xlang, output)
+        assert not output.exists()
+
+    def test_reversed_merge_range(self, tmp_path):
+        """A merge range given bottom-right first raises ValueError."""
+        xlang = "<xworkbook><xsheet name='Data'><xmerge addr='B2:A1'/></xsheet></xworkbook>"
+        output = tmp_path / "invalid.xlsx"
+
+        with pytest.raises(ValueError, match="top-left to bottom-right"):
+            compile_xlang_to_xlsx(xlang, output)
+        assert not output.exists()
+
 
 # ============================================================
 # File system error tests
@@ -255,3 +302,26 @@ class TestEdgeCaseErrors:
 
         assert ws["A1"].value == long_string
         assert len(ws["A1"].value) == 10000
+
+    def test_comments_ignored(self, tmp_path):
+        """XML comments are ignored by every parser backend."""
+        xlang = """
+        <xworkbook>
+          <!-- header -->
+          <xsheet name="Data">
+            <xrepeat times="2" r="1" c="A">
+              <!-- label column -->
+              <xv>Row {{i}}</xv>
+            </xrepeat>
+          </xsheet>
+        </xworkbook>
+        """
+        output = tmp_path / "comments.xlsx"
+        compile_xlang_to_xlsx(xlang, output)
+
+        from openpyxl import load_workbook
+        wb = load_workbook(output)
+        ws = wb["Data"]
+
+        assert ws["A1"].value == "Row 1"
+        assert ws["A2"].value == "Row 2"
@@ -4,6 +4,7 @@
 
 import pytest
 from exlang import col_letter_to_index, infer_value
+from exlang.helpers import CODEGEN_MIN_TIMES, compile_template, expand_template, substitute_template_vars
 
 
 # ============================================================
@@ -49,6 +50,12 @@ class TestColLetterToIndex:
         with pytest.raises(ValueError, match="Invalid column letter"):
             col_letter_to_index("A-B")
 
+    @pytest.mark.parametrize("col", ["XFE", "ZZZ", "ZZZZ"])
+    def test_past_last_column(self, col):
+        """Columns past XFD, Excel's last column, raise ValueError."""
+        with pytest.raises(ValueError, match="Column out of range"):
+            col_letter_to_index(col)
+
 
 # ============================================================
 # Value inference tests
@@ -118,3 +125,47 @@ class TestInferValue:
     def test_empty_string(self):
         """Empty string remains empty string."""
         assert infer_value("") == ""
+
+    def test_cached_results_keep_input_types_distinct(self):
+        """Memoisation does not conflate equal-hashing inputs like 1 and True."""
+        assert infer_value(1) == 1
+        assert infer_value(True) == "True"
+        assert infer_value(1.0) == 1.0
+        assert isinstance(infer_value(1.0), float)
+
+    def test_unhashable_input_accepted(self):
+        """Values are converted with str() before the memo, so any input works."""
+        assert infer_value(["a"]) == "['a']"
+
+
+# ============================================================
+# Template expansion tests
+# ============================================================
+
+class TestExpandTemplate:
+    """Test rendering compiled xrepeat templates for every iteration."""
+
+    def test_both_variables(self):
+        """{{i}} and {{i0}} render as 1-based and 0-based indexes."""
+        pattern = compile_template("R{{i}}/{{i0}}")
+        assert expand_template(pattern, 3) == ["R1/0", "R2/1", "R3/2"]
+
+    def test_literal_braces_kept(self):
+        """Braces that are not template variables survive expansion."""
+        pattern = compile_template("{x} {{i}}")
+        assert expand_template(pattern, 2) == ["{x} 1", "{x} 2"]
+
+    @pytest.mark.parametrize("text", ['say "hi" {{i}}', "back\\slash {{i}}", "line\nbreak {{i}}", "é {{i0}}"])
+    def test_literal_text_is_not_code(self, text):
+        """Quotes, backslashes and non-ASCII in templates are copied verbatim."""
+        pattern = compile_template(text)
+        assert expand_template(pattern, 2) == [substitute_template_vars(text, i) for i in (1, 2)]
+
+    @pytest.mark.parametrize("times", [1, CODEGEN_MIN_TIMES - 1, CODEGEN_MIN_TIMES, CODEGEN_MIN_TIMES + 1])
+    def test_short_and_long_repeats_agree(self, times):
+        """Direct formatting (short repeats) and generated expanders render the same values."""
+        text = 'say "{{i}}" {x} {{i0}}'
+        pattern = compile_template(text)
+        assert expand_template(pattern, times) == [
+            substitute_template_vars(text, i) for i in range(1, times + 1)
+        ]
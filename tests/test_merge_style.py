@@ -7,7 +7,8 @@ import pytest
 from openpyxl import load_workbook
 
 from exlang import compile_xlang_to_xlsx, validate_xlang_minimal
-from xml.etree import ElementTree as ET
+
+from tests import parse_xlang
 
 
 # ============================================================
@@ -350,7 +351,7 @@ def test_xmerge_missing_addr():
       </xsheet>
     </xworkbook>
     """
-    root = ET.fromstring(xlang)
+    root = parse_xlang(xlang)
     errors = validate_xlang_minimal(root)
     assert any("xmerge missing required attribute 'addr'" in e for e in errors)
 
@@ -364,7 +365,7 @@ def test_xmerge_invalid_format():
       </xsheet>
     </xworkbook>
     """
-    root = ET.fromstring(xlang)
+    root = parse_xlang(xlang)
     errors = validate_xlang_minimal(root)
     assert any("must be a range" in e for e in errors)
 
@@ -378,7 +379,7 @@ def test_xstyle_missing_addr():
       </xsheet>
     </xworkbook>
     """
-    root = ET.fromstring(xlang)
+    root = parse_xlang(xlang)
     errors = validate_xlang_minimal(root)
     assert any("xstyle missing required attribute 'addr'" in e for e in errors)
 
@@ -392,7 +393,7 @@ def test_xstyle_invalid_bool():
       </xsheet>
     </xworkbook>
     """
-    root = ET.fromstring(xlang)
+    root = parse_xlang(xlang)
     errors = validate_xlang_minimal(root)
     assert any("invalid bold='yes'" in e for e in errors)
 
@@ -406,7 +407,7 @@ def test_xstyle_multiple_invalid_bools():
       </xsheet>
     </xworkbook>
     """
-    root = ET.fromstring(xlang)
+    root = parse_xlang(xlang)
     errors = validate_xlang_minimal(root)
     assert any("invalid bold='1'" in e for e in errors)
     assert any("invalid italic='yes'" in e for e in errors)
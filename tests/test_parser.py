@@ -3,8 +3,10 @@
 # ============================================================
 
 import pytest
-from xml.etree import ElementTree as ET
-from exlang import validate_xlang_minimal
+from exlang import validate_xlang_minimal, validate_xlang_minimal_first, validate_xlang_stream
+from exlang._xml import ParseError, tostring
+
+from tests import parse_xlang
 
 
 # ============================================================
@@ -17,7 +19,7 @@ class TestValidDocuments:
     def test_minimal_valid_workbook(self):
         """Minimal valid workbook with one empty sheet."""
         xml = "<xworkbook><xsheet name='Test'></xsheet></xworkbook>"
-        root = ET.fromstring(xml)
+        root = parse_xlang(xml)
         errors = validate_xlang_minimal(root)
         assert errors == []
 
@@ -31,7 +33,7 @@ class TestValidDocuments:
           </xsheet>
         </xworkbook>
         """
-        root = ET.fromstring(xml)
+        root = parse_xlang(xml)
         errors = validate_xlang_minimal(root)
         assert errors == []
 
@@ -45,7 +47,7 @@ class TestValidDocuments:
           </xsheet>
         </xworkbook>
         """
-        root = ET.fromstring(xml)
+        root = parse_xlang(xml)
         errors = validate_xlang_minimal(root)
         assert errors == []
 
@@ -58,7 +60,7 @@ class TestValidDocuments:
           <xsheet name="Sheet3"></xsheet>
         </xworkbook>
         """
-        root = ET.fromstring(xml)
+        root = parse_xlang(xml)
         errors = validate_xlang_minimal(root)
         assert errors == []
 
@@ -74,7 +76,7 @@ class TestValidDocuments:
           </xsheet>
         </xworkbook>
         """
-        root = ET.fromstring(xml)
+        root = parse_xlang(xml)
         errors = validate_xlang_minimal(root)
         assert errors == []
 
@@ -89,7 +91,7 @@ class TestInvalidDocuments:
     def test_wrong_root_tag(self):
         """Root tag must be xworkbook."""
         xml = "<workbook><xsheet name='Test'></xsheet></workbook>"
-        root = ET.fromstring(xml)
+        root = parse_xlang(xml)
         errors = validate_xlang_minimal(root)
         assert len(errors) == 1
         assert "Root tag must be 'xworkbook'" in errors[0]
@@ -104,7 +106,7 @@ class TestInvalidDocuments:
           </xsheet>
         </xworkbook>
         """
-        root = ET.fromstring(xml)
+        root = parse_xlang(xml)
         errors = validate_xlang_minimal(root)
         assert len(errors) == 1
         assert "xrow missing required attribute 'r'" in errors[0]
@@ -118,7 +120,7 @@ class TestInvalidDocuments:
           </xsheet>
         </xworkbook>
         """
-        root = ET.fromstring(xml)
+        root = parse_xlang(xml)
         errors = validate_xlang_minimal(root)
         assert any("xcell missing required attribute 'addr'" in e for e in errors)
 
@@ -131,7 +133,7 @@ class TestInvalidDocuments:
           </xsheet>
         </xworkbook>
         """
-        root = ET.fromstring(xml)
+        root = parse_xlang(xml)
         errors = validate_xlang_minimal(root)
         assert any("xcell missing required attribute 'v'" in e for e in errors)
 
@@ -144,7 +146,7 @@ class TestInvalidDocuments:
           </xsheet>
         </xworkbook>
         """
-        root = ET.fromstring(xml)
+        root = parse_xlang(xml)
         errors = validate_xlang_minimal(root)
         assert len(errors) == 1
         assert "invalid type hint t='invalid_type'" in errors[0]
@@ -160,7 +162,84 @@ class TestInvalidDocuments:
           </xsheet>
         </xworkbook>
         """
-        root = ET.fromstring(xml)
+        root = parse_xlang(xml)
         errors = validate_xlang_minimal(root)
         # Should have: missing xrow r, missing xcell addr
         assert len(errors) >= 2
+
+    def test_validation_does_not_mutate_tree(self):
+        """Validation leaves the tree untouched, so cached trees can be shared."""
+        xml = """
+        <xworkbook>
+          <xsheet name="Data">
+            <xrow><xv>A</xv></xrow>
+            <xrepeat times="0"><xv>{{i}}</xv></xrepeat>
+            <xstyle addr="A1" bold="yes"/>
+          </xsheet>
+        </xworkbook>
+        """
+        root = parse_xlang(xml)
+        before = tostring(root)
+        assert validate_xlang_minimal(root)
+        assert tostring(root) == before
+
+
+# ============================================================
+# First-error validation tests
+# ============================================================
+
+class TestValidateFirst:
+    """Test the fail-fast validate_xlang_minimal_first() entry point."""
+
+    def test_valid_document_returns_none(self):
+        """A valid document has no first error."""
+        root = parse_xlang("<xworkbook><xsheet name='A'><xcell addr='A1' v='1'/></xsheet></xworkbook>")
+        assert validate_xlang_minimal_first(root) is None
+
+    def test_returns_first_element_error(self):
+        """The first error in document order is returned."""
+        xml = """
+        <xworkbook>
+          <xsheet name="A"><xrow><xv>1</xv></xrow></xsheet>
+          <xsheet name="B"><xcell v="2"/></xsheet>
+        </xworkbook>
+        """
+        root = parse_xlang(xml)
+        assert validate_xlang_minimal_first(root) == "xrow missing required attribute 'r'"
+
+    def test_reports_name_collision(self):
+        """Name collisions are found once every element has passed."""
+        xml = "<xworkbook><xsheet name='Sheet1'/><xsheet/></xworkbook>"
+        root = parse_xlang(xml)
+        first = validate_xlang_minimal_first(root)
+        assert first is not None and "conflicts" in first
+        assert validate_xlang_minimal(root) == [first]
+
+
+# ============================================================
+# Streaming validation tests
+# ============================================================
+
+class TestValidateStream:
+    """Test that validate_xlang_stream() matches validate_xlang_minimal()."""
+
+    @pytest.mark.parametrize("xml", [
+        "<xworkbook><xsheet name='A'><xrow r='1'><xv>1</xv></xrow></xsheet></xworkbook>",
+        "<workbook><xsheet name='A'/></workbook>",
+        """
+        <xworkbook>
+          <xsheet name="Sheet2"><xrow><xv>A</xv></xrow></xsheet>
+          <xsheet/>
+          <xsheet><xrepeat times="0"><xcell addr="A1" v="1"/></xrepeat></xsheet>
+          <xsheet name="S"><xstyle addr="A1" bold="yes"/><xmerge addr="A1"/></xsheet>
+        </xworkbook>
+        """,
+    ])
+    def test_matches_tree_validation(self, xml):
+        """Same errors, in the same order, as the tree-based validator."""
+        assert validate_xlang_stream(xml) == validate_xlang_minimal(parse_xlang(xml))
+
+    def test_malformed_xml_raises(self):
+        """Malformed XML raises ParseError."""
+        with pytest.raises(ParseError):
+            validate_xlang_stream("<xworkbook><xsheet></xworkbook>")
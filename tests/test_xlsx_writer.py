@@ -0,0 +1,128 @@
+# ============================================================
+# tests.test_xlsx_writer: direct .xlsx emission
+# ============================================================
+
+import zipfile
+
+import pytest
+from openpyxl import load_workbook
+
+from exlang import compile_xlang_to_xlsx
+from exlang.xlsx_writer import COL_LETTERS, unique_sheet_title
+
+
+# ============================================================
+# Column letter table tests
+# ============================================================
+
+class TestColLetters:
+    """Test the precomputed column letter table."""
+
+    @pytest.mark.parametrize("idx,expected", [
+        (1, "A"),
+        (26, "Z"),
+        (27, "AA"),
+        (702, "ZZ"),
+        (703, "AAA"),
+        (16384, "XFD"),
+    ])
+    def test_known_columns(self, idx, expected):
+        """Table entries match Excel column names."""
+        assert COL_LETTERS[idx] == expected
+
+    def test_table_size(self):
+        """Table covers every Excel column (index 0 unused)."""
+        assert len(COL_LETTERS) == 16385
+
+
+# ============================================================
+# Sheet title tests
+# ============================================================
+
+class TestUniqueSheetTitle:
+    """Test sheet title validation and de-duplication."""
+
+    def test_new_title_unchanged(self):
+        """A title not yet used is returned as-is."""
+        assert unique_sheet_title("Data", ["Summary"]) == "Data"
+
+    def test_duplicate_gets_suffix(self):
+        """Duplicate titles get a numeric suffix (case-insensitive)."""
+        assert unique_sheet_title("Data", ["Data"]) == "Data1"
+        assert unique_sheet_title("data", ["Data", "Data1"]) == "data2"
+
+    def test_invalid_character(self):
+        """Characters Excel forbids in titles raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid character"):
+            unique_sheet_title("Q1/Q2", [])
+
+    def test_title_too_long(self):
+        """Titles longer than Excel's 31 characters raise ValueError."""
+        assert unique_sheet_title("x" * 31, []) == "x" * 31
+        with pytest.raises(ValueError, match="longer than 31 characters"):
+            unique_sheet_title("x" * 32, [])
+
+    def test_suffix_fits_title_limit(self):
+        """A duplicate 31-character title is shortened to fit its suffix."""
+        assert unique_sheet_title("x" * 31, ["x" * 31]) == "x" * 30 + "1"
+
+
+# ============================================================
+# Package output tests
+# ============================================================
+
+class TestPackageOutput:
+    """Test the structure and content of written packages."""
+
+    def test_required_parts_present(self, tmp_path):
+        """Generated package contains the minimal SpreadsheetML parts."""
+        xlang = """
+        <xworkbook>
+          <xsheet name="A"><xcell addr="A1" v="1"/></xsheet>
+          <xsheet name="B"><xcell addr="A1" v="2"/></xsheet>
+        </xworkbook>
+        """
+        output = tmp_path / "parts.xlsx"
+        compile_xlang_to_xlsx(xlang, output)
+
+        with zipfile.ZipFile(output) as archive:
+            names = set(archive.namelist())
+        assert {
+            "[Content_Types].xml",
+            "_rels/.rels",
+            "xl/workbook.xml",
+            "xl/_rels/workbook.xml.rels",
+            "xl/styles.xml",
+            "xl/worksheets/sheet1.xml",
+            "xl/worksheets/sheet2.xml",
+        } <= names
+
+    def test_whitespace_preserved(self, tmp_path):
+        """Leading and trailing spaces in strings survive the round trip."""
+        xlang = """
+        <xworkbook>
+          <xsheet name="Data"><xcell addr="A1" v="  padded  "/></xsheet>
+        </xworkbook>
+        """
+        output = tmp_path / "spaces.xlsx"
+        compile_xlang_to_xlsx(xlang, output)
+
+        ws = load_workbook(output)["Data"]
+        assert ws["A1"].value == "  padded  "
+
+    def test_merged_cells_keep_anchor_value_only(self, tmp_path):
+        """Cells covered by a merge (other than the top-left) are emptied."""
+        xlang = """
+        <xworkbook>
+          <xsheet name="Data">
+            <xrow r="1"><xv>Title</xv><xv>Hidden</xv></xrow>
+            <xmerge addr="A1:B1"/>
+          </xsheet>
+        </xworkbook>
+        """
+        output = tmp_path / "merge_values.xlsx"
+        compile_xlang_to_xlsx(xlang, output)
+
+        ws = load_workbook(output)["Data"]
+        assert ws["A1"].value == "Title"
+        assert ws["B1"].value is None
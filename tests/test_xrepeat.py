@@ -9,6 +9,13 @@ from xml.etree import ElementTree as ET
 
 from exlang import compile_xlang_to_xlsx, validate_xlang_minimal
 
+from tests import parse_xlang
+
+
+# Single-sheet workbook holding one xrepeat; tests fill in its attributes and
+# <xv> children
+XREPEAT_TMPL = "<xworkbook><xsheet name='Test'><xrepeat {attrs}>{body}</xrepeat></xsheet></xworkbook>"
+
 
 # ============================================================
 # Basic xrepeat Tests
@@ -16,15 +23,7 @@ from exlang import compile_xlang_to_xlsx, validate_xlang_minimal
 
 def test_xrepeat_basic_down(tmp_path):
     """Basic xrepeat with downward direction."""
-    xlang = """
-    <xworkbook>
-      <xsheet name="Test">
-        <xrepeat times="3" r="1" c="A">
-          <xv>Row {{i}}</xv>
-        </xrepeat>
-      </xsheet>
-    </xworkbook>
-    """
+    xlang = XREPEAT_TMPL.format(attrs='times="3" r="1" c="A"', body="<xv>Row {{i}}</xv>")
     output = tmp_path / "xrepeat_basic_down.xlsx"
     compile_xlang_to_xlsx(xlang, output)
     
@@ -38,15 +37,7 @@ def test_xrepeat_basic_down(tmp_path):
 
 def test_xrepeat_basic_right(tmp_path):
     """Basic xrepeat with rightward direction."""
-    xlang = """
-    <xworkbook>
-      <xsheet name="Test">
-        <xrepeat times="3" r="1" c="A" direction="right">
-          <xv>Col {{i}}</xv>
-        </xrepeat>
-      </xsheet>
-    </xworkbook>
-    """
+    xlang = XREPEAT_TMPL.format(attrs='times="3" r="1" c="A" direction="right"', body="<xv>Col {{i}}</xv>")
     output = tmp_path / "xrepeat_basic_right.xlsx"
     compile_xlang_to_xlsx(xlang, output)
     
@@ -60,16 +51,7 @@ def test_xrepeat_basic_right(tmp_path):
 
 def test_xrepeat_multiple_xv(tmp_path):
     """xrepeat with multiple xv elements."""
-    xlang = """
-    <xworkbook>
-      <xsheet name="Test">
-        <xrepeat times="4" r="2" c="B">
-          <xv>Month {{i}}</xv>
-          <xv>0</xv>
-        </xrepeat>
-      </xsheet>
-    </xworkbook>
-    """
+    xlang = XREPEAT_TMPL.format(attrs='times="4" r="2" c="B"', body="<xv>Month {{i}}</xv><xv>0</xv>")
     output = tmp_path / "xrepeat_multiple_xv.xlsx"
     compile_xlang_to_xlsx(xlang, output)
     
@@ -92,15 +74,7 @@ def test_xrepeat_multiple_xv(tmp_path):
 
 def test_xrepeat_zero_based_index(tmp_path):
     """xrepeat with {{i0}} zero-based index."""
-    xlang = """
-    <xworkbook>
-      <xsheet name="Test">
-        <xrepeat times="3" r="1" c="A">
-          <xv>Index {{i0}}</xv>
-        </xrepeat>
-      </xsheet>
-    </xworkbook>
-    """
+    xlang = XREPEAT_TMPL.format(attrs='times="3" r="1" c="A"', body="<xv>Index {{i0}}</xv>")
     output = tmp_path / "xrepeat_i0.xlsx"
     compile_xlang_to_xlsx(xlang, output)
     
@@ -114,16 +88,7 @@ def test_xrepeat_zero_based_index(tmp_path):
 
 def test_xrepeat_both_indices(tmp_path):
     """xrepeat with both {{i}} and {{i0}}."""
-    xlang = """
-    <xworkbook>
-      <xsheet name="Test">
-        <xrepeat times="2" r="1" c="A">
-          <xv>Row {{i}}</xv>
-          <xv>Index {{i0}}</xv>
-        </xrepeat>
-      </xsheet>
-    </xworkbook>
-    """
+    xlang = XREPEAT_TMPL.format(attrs='times="2" r="1" c="A"', body="<xv>Row {{i}}</xv><xv>Index {{i0}}</xv>")
     output = tmp_path / "xrepeat_both_indices.xlsx"
     compile_xlang_to_xlsx(xlang, output)
     
@@ -136,21 +101,26 @@ def test_xrepeat_both_indices(tmp_path):
     assert ws["B2"].value == "Index 1"
 
 
+def test_xrepeat_literal_braces_preserved(tmp_path):
+    """Braces that are not template variables are kept verbatim."""
+    xlang = XREPEAT_TMPL.format(attrs='times="2" r="1" c="A"', body="<xv>{id} {{i}} {{name}}</xv>")
+    output = tmp_path / "xrepeat_braces.xlsx"
+    compile_xlang_to_xlsx(xlang, output)
+    
+    wb = load_workbook(output)
+    ws = wb["Test"]
+    
+    assert ws["A1"].value == "{id} 1 {{name}}"
+    assert ws["A2"].value == "{id} 2 {{name}}"
+
+
 # ============================================================
 # Direction Tests
 # ============================================================
 
 def test_xrepeat_direction_down_explicit(tmp_path):
     """Explicit direction='down' works correctly."""
-    xlang = """
-    <xworkbook>
-      <xsheet name="Test">
-        <xrepeat times="3" r="5" c="C" direction="down">
-          <xv>Item {{i}}</xv>
-        </xrepeat>
-      </xsheet>
-    </xworkbook>
-    """
+    xlang = XREPEAT_TMPL.format(attrs='times="3" r="5" c="C" direction="down"', body="<xv>Item {{i}}</xv>")
     output = tmp_path / "xrepeat_down_explicit.xlsx"
     compile_xlang_to_xlsx(xlang, output)
     
@@ -164,16 +134,7 @@ def test_xrepeat_direction_down_explicit(tmp_path):
 
 def test_xrepeat_direction_right_multiple_xv(tmp_path):
     """direction='right' with multiple xv elements."""
-    xlang = """
-    <xworkbook>
-      <xsheet name="Test">
-        <xrepeat times="3" r="1" c="A" direction="right">
-          <xv>Q{{i}}</xv>
-          <xv>0</xv>
-        </xrepeat>
-      </xsheet>
-    </xworkbook>
-    """
+    xlang = XREPEAT_TMPL.format(attrs='times="3" r="1" c="A" direction="right"', body="<xv>Q{{i}}</xv><xv>0</xv>")
     output = tmp_path / "xrepeat_right_multiple.xlsx"
     compile_xlang_to_xlsx(xlang, output)
     
@@ -197,15 +158,7 @@ def test_xrepeat_direction_right_multiple_xv(tmp_path):
 
 def test_xrepeat_default_position(tmp_path):
     """xrepeat defaults to r=1, c=A."""
-    xlang = """
-    <xworkbook>
-      <xsheet name="Test">
-        <xrepeat times="2">
-          <xv>Default {{i}}</xv>
-        </xrepeat>
-      </xsheet>
-    </xworkbook>
-    """
+    xlang = XREPEAT_TMPL.format(attrs='times="2"', body="<xv>Default {{i}}</xv>")
     output = tmp_path / "xrepeat_defaults.xlsx"
     compile_xlang_to_xlsx(xlang, output)
     
@@ -218,15 +171,7 @@ def test_xrepeat_default_position(tmp_path):
 
 def test_xrepeat_default_direction(tmp_path):
     """xrepeat defaults to direction=down."""
-    xlang = """
-    <xworkbook>
-      <xsheet name="Test">
-        <xrepeat times="2" r="3" c="B">
-          <xv>Down {{i}}</xv>
-        </xrepeat>
-      </xsheet>
-    </xworkbook>
-    """
+    xlang = XREPEAT_TMPL.format(attrs='times="2" r="3" c="B"', body="<xv>Down {{i}}</xv>")
     output = tmp_path / "xrepeat_default_direction.xlsx"
     compile_xlang_to_xlsx(xlang, output)
     
@@ -346,74 +291,115 @@ def test_multiple_xrepeats(tmp_path):
     assert ws["C2"].value == "Second 2"
 
 
+# Constant xrepeat rows with an xrow and an xcell overriding single cells
+XREPEAT_CONSTANT_ROWS = """
+<xworkbook>
+  <xsheet name="Test">
+    <xrow r="2" c="C"><xv>Kept</xv></xrow>
+    <xrepeat times="3" r="1" c="A">
+      <xv>Same</xv>
+      <xv>0</xv>
+    </xrepeat>
+    <xcell addr="B2" v="99"/>
+  </xsheet>
+</xworkbook>
+"""
+
+
+def test_xrepeat_constant_rows_independent(compiled_xlsx):
+    """Rows of a constant xrepeat can be overridden one at a time."""
+    wb = load_workbook(compiled_xlsx(XREPEAT_CONSTANT_ROWS), read_only=True)
+    try:
+        rows = list(wb["Test"].iter_rows(min_row=1, max_row=3, max_col=3, values_only=True))
+    finally:
+        wb.close()
+
+    assert rows == [
+        ("Same", 0, None),
+        ("Same", 99, "Kept"),
+        ("Same", 0, None),
+    ]
+
+
 # ============================================================
 # Large Repetition Tests
 # ============================================================
 
-def test_xrepeat_large_times(tmp_path):
+XREPEAT_LARGE = """
+<xworkbook>
+  <xsheet name="Test">
+    <xrepeat times="50" r="1" c="A">
+      <xv>Row {{i}}</xv>
+    </xrepeat>
+  </xsheet>
+</xworkbook>
+"""
+
+# This single xrepeat tag replaces 12 xrow tags
+XREPEAT_COMPRESSION = """
+<xworkbook>
+  <xsheet name="Test">
+    <xrow r="1"><xv>Month</xv><xv>Budget</xv></xrow>
+    <xrepeat times="12" r="2" c="A">
+      <xv>Month {{i}}</xv>
+      <xv>0</xv>
+    </xrepeat>
+  </xsheet>
+</xworkbook>
+"""
+
+
+def test_xrepeat_large_times(compiled_xlsx):
     """xrepeat with large times value."""
-    xlang = """
-    <xworkbook>
-      <xsheet name="Test">
-        <xrepeat times="50" r="1" c="A">
-          <xv>Row {{i}}</xv>
-        </xrepeat>
-      </xsheet>
-    </xworkbook>
-    """
-    output = tmp_path / "xrepeat_large.xlsx"
-    compile_xlang_to_xlsx(xlang, output)
-    
-    wb = load_workbook(output)
-    ws = wb["Test"]
-    
-    assert ws["A1"].value == "Row 1"
-    assert ws["A25"].value == "Row 25"
-    assert ws["A50"].value == "Row 50"
-
-
-def test_xrepeat_compression_benefit(tmp_path):
+    wb = load_workbook(compiled_xlsx(XREPEAT_LARGE), read_only=True)
+    try:
+        column_a = [
+            a for (a,) in wb["Test"].iter_rows(
+                min_row=1, max_row=50, max_col=1, values_only=True
+            )
+        ]
+    finally:
+        wb.close()
+
+    assert column_a[0] == "Row 1"
+    assert column_a[24] == "Row 25"
+    assert column_a[49] == "Row 50"
+
+
+def test_xrepeat_compression_benefit(compiled_xlsx):
     """Demonstrate ORO benefit of xrepeat."""
-    # This single xrepeat tag replaces 12 xrow tags
-    xlang = """
-    <xworkbook>
-      <xsheet name="Test">
-        <xrow r="1"><xv>Month</xv><xv>Budget</xv></xrow>
-        <xrepeat times="12" r="2" c="A">
-          <xv>Month {{i}}</xv>
-          <xv>0</xv>
-        </xrepeat>
-      </xsheet>
-    </xworkbook>
-    """
-    output = tmp_path / "xrepeat_compression.xlsx"
-    compile_xlang_to_xlsx(xlang, output)
-    
-    wb = load_workbook(output)
-    ws = wb["Test"]
-    
+    wb = load_workbook(compiled_xlsx(XREPEAT_COMPRESSION), read_only=True)
+    try:
+        rows = list(wb["Test"].iter_rows(min_row=2, max_row=13, max_col=2, values_only=True))
+    finally:
+        wb.close()
+
     # Verify all 12 months created
-    for i in range(1, 13):
-        assert ws[f"A{i+1}"].value == f"Month {i}"
-        assert ws[f"B{i+1}"].value == 0
+    assert len(rows) == 12
+    for i, (a, b) in enumerate(rows, start=1):
+        assert a == f"Month {i}"
+        assert b == 0
 
 
 # ============================================================
 # Validation Error Tests
 # ============================================================
 
+def _xrepeat_tree(**attrs):
+    """
+    Build <xworkbook><xsheet name="Test"><xrepeat .../></xsheet></xworkbook>
+    directly, skipping the XML parser; validation only inspects tags and
+    attributes. Returns (root, xrepeat) so tests can add children.
+    """
+    root = ET.Element("xworkbook")
+    sheet = ET.SubElement(root, "xsheet", name="Test")
+    return root, ET.SubElement(sheet, "xrepeat", attrs)
+
+
 def test_xrepeat_missing_times():
     """xrepeat without times attribute fails validation."""
-    xlang = """
-    <xworkbook>
-      <xsheet name="Test">
-        <xrepeat r="1" c="A">
-          <xv>Test</xv>
-        </xrepeat>
-      </xsheet>
-    </xworkbook>
-    """
-    root = ET.fromstring(xlang)
+    root, xrepeat = _xrepeat_tree(r="1", c="A")
+    ET.SubElement(xrepeat, "xv").text = "Test"
     errors = validate_xlang_minimal(root)
     
     assert len(errors) == 1
@@ -422,16 +408,8 @@ def test_xrepeat_missing_times():
 
 def test_xrepeat_invalid_times_non_integer():
     """xrepeat with non-integer times fails validation."""
-    xlang = """
-    <xworkbook>
-      <xsheet name="Test">
-        <xrepeat times="abc" r="1" c="A">
-          <xv>Test</xv>
-        </xrepeat>
-      </xsheet>
-    </xworkbook>
-    """
-    root = ET.fromstring(xlang)
+    root, xrepeat = _xrepeat_tree(times="abc", r="1", c="A")
+    ET.SubElement(xrepeat, "xv").text = "Test"
     errors = validate_xlang_minimal(root)
     
     assert len(errors) == 1
@@ -440,16 +418,8 @@ def test_xrepeat_invalid_times_non_integer():
 
 def test_xrepeat_invalid_times_zero():
     """xrepeat with times=0 fails validation."""
-    xlang = """
-    <xworkbook>
-      <xsheet name="Test">
-        <xrepeat times="0" r="1" c="A">
-          <xv>Test</xv>
-        </xrepeat>
-      </xsheet>
-    </xworkbook>
-    """
-    root = ET.fromstring(xlang)
+    root, xrepeat = _xrepeat_tree(times="0", r="1", c="A")
+    ET.SubElement(xrepeat, "xv").text = "Test"
     errors = validate_xlang_minimal(root)
     
     assert len(errors) == 1
@@ -458,34 +428,38 @@ def test_xrepeat_invalid_times_zero():
 
 def test_xrepeat_invalid_times_negative():
     """xrepeat with negative times fails validation."""
-    xlang = """
-    <xworkbook>
-      <xsheet name="Test">
-        <xrepeat times="-5" r="1" c="A">
-          <xv>Test</xv>
-        </xrepeat>
-      </xsheet>
-    </xworkbook>
-    """
-    root = ET.fromstring(xlang)
+    root, xrepeat = _xrepeat_tree(times="-5", r="1", c="A")
+    ET.SubElement(xrepeat, "xv").text = "Test"
     errors = validate_xlang_minimal(root)
     
     assert len(errors) == 1
     assert "must be >= 1" in errors[0]
 
 
+@pytest.mark.parametrize("times", ["3", "+3", " 3 ", "1_0"])
+def test_xrepeat_times_accepts_int_syntax(times):
+    """times accepts anything int() does, not only plain digits."""
+    root, xrepeat = _xrepeat_tree(times=times, r="1", c="A")
+    ET.SubElement(xrepeat, "xv").text = "Test"
+
+    assert validate_xlang_minimal(root) == []
+
+
+@pytest.mark.parametrize("times", ["-", "--2", "3.0", "²"])
+def test_xrepeat_times_rejects_non_int(times):
+    """Signs alone, decimals and non-decimal digits are not integers."""
+    root, xrepeat = _xrepeat_tree(times=times, r="1", c="A")
+    ET.SubElement(xrepeat, "xv").text = "Test"
+    errors = validate_xlang_minimal(root)
+
+    assert len(errors) == 1
+    assert "must be an integer" in errors[0]
+
+
 def test_xrepeat_invalid_direction():
     """xrepeat with invalid direction fails validation."""
-    xlang = """
-    <xworkbook>
-      <xsheet name="Test">
-        <xrepeat times="3" direction="diagonal">
-          <xv>Test</xv>
-        </xrepeat>
-      </xsheet>
-    </xworkbook>
-    """
-    root = ET.fromstring(xlang)
+    root, xrepeat = _xrepeat_tree(times="3", direction="diagonal")
+    ET.SubElement(xrepeat, "xv").text = "Test"
     errors = validate_xlang_minimal(root)
     
     assert len(errors) == 1
@@ -494,7 +468,7 @@ def test_xrepeat_invalid_direction():
 
 
 def test_xrepeat_nested_not_allowed():
-    """Nested xrepeat fails validation."""
+    """Nested xrepeat fails validation (parsed from text as a parser smoke test)."""
     xlang = """
     <xworkbook>
       <xsheet name="Test">
@@ -507,7 +481,7 @@ def test_xrepeat_nested_not_allowed():
       </xsheet>
     </xworkbook>
     """
-    root = ET.fromstring(xlang)
+    root = parse_xlang(xlang)
     errors = validate_xlang_minimal(root)
     
     assert any("Nested xrepeat is not allowed" in e for e in errors)
@@ -515,16 +489,8 @@ def test_xrepeat_nested_not_allowed():
 
 def test_xrepeat_invalid_content_xcell():
     """xrepeat with xcell child fails validation."""
-    xlang = """
-    <xworkbook>
-      <xsheet name="Test">
-        <xrepeat times="3">
-          <xcell addr="A1" v="Test"/>
-        </xrepeat>
-      </xsheet>
-    </xworkbook>
-    """
-    root = ET.fromstring(xlang)
+    root, xrepeat = _xrepeat_tree(times="3")
+    ET.SubElement(xrepeat, "xcell", addr="A1", v="Test")
     errors = validate_xlang_minimal(root)
     
     assert any("can only contain <xv> tags" in e for e in errors)
@@ -532,16 +498,9 @@ def test_xrepeat_invalid_content_xcell():
 
 def test_xrepeat_invalid_content_xrow():
     """xrepeat with xrow child fails validation."""
-    xlang = """
-    <xworkbook>
-      <xsheet name="Test">
-        <xrepeat times="3">
-          <xrow r="1"><xv>Test</xv></xrow>
-        </xrepeat>
-      </xsheet>
-    </xworkbook>
-    """
-    root = ET.fromstring(xlang)
+    root, xrepeat = _xrepeat_tree(times="3")
+    xrow = ET.SubElement(xrepeat, "xrow", r="1")
+    ET.SubElement(xrow, "xv").text = "Test"
     errors = validate_xlang_minimal(root)
     
     assert any("can only contain <xv> tags" in e for e in errors)